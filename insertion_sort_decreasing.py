@@ -1,26 +1,1651 @@
-def insertion_sort_decreasing(arr):
-    sorted_arr = arr.copy()
-    for i in range(1, len(sorted_arr)):
-        current_element = sorted_arr[i]
-        j = i - 1
-        while j >= 0 and sorted_arr[j] < current_element:
-            sorted_arr[j + 1] = sorted_arr[j]
-            j -= 1
-        sorted_arr[j + 1] = current_element
-    return sorted_arr
+import asyncio
+import heapq
+import mmap
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import chain, repeat
+from operator import attrgetter, itemgetter
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python engines need nothing else
+    np = None
+
+
+def _bisect_decreasing(arr, x, lo, hi):
+    # First index in arr[lo:hi] holding an element smaller than x, so x lands
+    # after every equal element already placed (keeps the sort stable).
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if arr[mid] < x:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+DEFAULT_CUTOFF = 32
+DEFAULT_MERGE_BUFFER = 1024
+
+
+def _copy_slice(arr, lo, hi):
+    # arr[lo:hi] as an independent copy. Slicing a memoryview only makes a new
+    # view of the same memory, so copy those into a typed array instead.
+    chunk = arr[lo:hi]
+    if type(chunk) is memoryview:
+        return array(chunk.format, chunk.tobytes())
+    return chunk
+
+
+def _reverse_range(arr, lo, hi, chunk):
+    # Reverses arr[lo:hi] while never holding more than 2 * chunk elements aside.
+    while hi - lo > 2 * chunk:
+        head = _copy_slice(arr, lo, lo + chunk)
+        arr[lo:lo + chunk] = _copy_slice(arr, hi - chunk, hi)[::-1]
+        arr[hi - chunk:hi] = head[::-1]
+        lo += chunk
+        hi -= chunk
+    arr[lo:hi] = _copy_slice(arr, lo, hi)[::-1]
+
 
+def _leading_run(arr, lo, hi):
+    # End of the monotone run starting at lo. A non-increasing run is already
+    # in order; a strictly increasing run is reversed in place, which is stable
+    # because it holds no equal elements. Either way arr[lo:end] ends up sorted.
+    if hi - lo < 2:
+        return hi
+    end = lo + 2
+    if arr[lo] < arr[lo + 1]:
+        while end < hi and arr[end - 1] < arr[end]:
+            end += 1
+        _reverse_range(arr, lo, end, DEFAULT_MERGE_BUFFER)
+    else:
+        while end < hi and not arr[end - 1] < arr[end]:
+            end += 1
+    return end
 
-def insertion_sort_decreasing_inplace(arr):
-    for i in range(1, len(arr)):
+
+# Every engine takes its outer loop's range() as the _range argument so
+# sort_with_stats can observe outer iterations without adding a check to the
+# uninstrumented loops. The insertion engines start after the leading run, so
+# presorted input (either direction) costs O(n).
+def _linear_insertion(arr, lo=0, hi=None, _range=range):
+    if hi is None:
+        hi = len(arr)
+    for i in _range(_leading_run(arr, lo, hi), hi):
         current_element = arr[i]
         j = i - 1
-        while j >= 0 and arr[j] < current_element:
+        while j >= lo and arr[j] < current_element:
             arr[j + 1] = arr[j]
             j -= 1
         arr[j + 1] = current_element
     return arr
 
 
+def _binary_insert_tail(arr, lo, start, hi, _range=range):
+    # Inserts arr[start:hi] into the already sorted arr[lo:start].
+    for i in _range(start, hi):
+        current_element = arr[i]
+        pos = _bisect_decreasing(arr, current_element, lo, i)
+        if pos < i:
+            arr[pos + 1:i + 1] = arr[pos:i]
+            arr[pos] = current_element
+    return arr
+
+
+def _binary_insertion(arr, lo=0, hi=None, _range=range):
+    if hi is None:
+        hi = len(arr)
+    return _binary_insert_tail(arr, lo, _leading_run(arr, lo, hi), hi, _range)
+
+
+def _bisect_decreasing_left(arr, x, lo, hi):
+    # First index in arr[lo:hi] holding an element that is not larger than x.
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if x < arr[mid]:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _rotate(arr, lo, mid, hi, chunk):
+    _reverse_range(arr, lo, mid, chunk)
+    _reverse_range(arr, mid, hi, chunk)
+    _reverse_range(arr, lo, hi, chunk)
+
+
+def _merge_low(arr, lo, mid, hi):
+    # Left run goes to the buffer; merge front to back.
+    buf = _copy_slice(arr, lo, mid)
+    n = len(buf)
+    i = 0
+    j = mid
+    k = lo
+    while i < n and j < hi:
+        if buf[i] < arr[j]:
+            arr[k] = arr[j]
+            j += 1
+        else:
+            arr[k] = buf[i]
+            i += 1
+        k += 1
+    if i < n:
+        arr[k:k + n - i] = buf[i:]
+
+
+def _merge_high(arr, lo, mid, hi):
+    # Right run goes to the buffer; merge back to front.
+    buf = _copy_slice(arr, mid, hi)
+    i = mid - 1
+    j = len(buf) - 1
+    k = hi - 1
+    while i >= lo and j >= 0:
+        if arr[i] < buf[j]:
+            arr[k] = arr[i]
+            i -= 1
+        else:
+            arr[k] = buf[j]
+            j -= 1
+        k -= 1
+    if j >= 0:
+        arr[lo:lo + j + 1] = buf[:j + 1]
+
+
+def _merge_decreasing(arr, lo, mid, hi, buffer_size):
+    # Stable merge of the decreasing runs arr[lo:mid] and arr[mid:hi]: on ties
+    # the element from the left run is emitted first.
+    if lo >= mid or mid >= hi or not arr[mid - 1] < arr[mid]:
+        return
+    # Leading left elements and trailing right elements are already in place.
+    lo = _bisect_decreasing(arr, arr[mid], lo, mid)
+    hi = _bisect_decreasing_left(arr, arr[mid - 1], mid, hi)
+    len1 = mid - lo
+    len2 = hi - mid
+    if len1 <= len2 and len1 <= buffer_size:
+        _merge_low(arr, lo, mid, hi)
+    elif len2 <= buffer_size:
+        _merge_high(arr, lo, mid, hi)
+    elif len1 <= buffer_size:
+        _merge_low(arr, lo, mid, hi)
+    else:
+        # Neither run fits in the buffer: split both around a pivot, rotate the
+        # middle blocks into place and merge the two halves independently.
+        if len1 > len2:
+            first_cut = lo + len1 // 2
+            second_cut = _bisect_decreasing_left(arr, arr[first_cut], mid, hi)
+        else:
+            second_cut = mid + len2 // 2
+            first_cut = _bisect_decreasing(arr, arr[second_cut], lo, mid)
+        _rotate(arr, first_cut, mid, second_cut, buffer_size)
+        new_mid = first_cut + (second_cut - mid)
+        _merge_decreasing(arr, lo, first_cut, new_mid, buffer_size)
+        _merge_decreasing(arr, new_mid, second_cut, hi, buffer_size)
+
+
+def _hybrid_sort(arr, lo=0, hi=None, cutoff=DEFAULT_CUTOFF, buffer_size=None, _range=range):
+    if hi is None:
+        hi = len(arr)
+    if cutoff < 1:
+        raise ValueError(f"cutoff must be at least 1, got {cutoff}")
+    if buffer_size is None:
+        buffer_size = hi - lo
+    elif buffer_size < 1:
+        raise ValueError(f"buffer_size must be at least 1, got {buffer_size}")
+    # Split into natural runs, extending short ones to cutoff elements with
+    # binary insertion. Every run covers at least one element, so the loop
+    # ends long before its range is exhausted.
+    bounds = [lo]
+    start = lo
+    for _ in _range(hi - lo):
+        if start >= hi:
+            break
+        end = _leading_run(arr, start, hi)
+        if end - start < cutoff:
+            stop = min(start + cutoff, hi)
+            _binary_insert_tail(arr, start, end, stop)
+            end = stop
+        bounds.append(end)
+        start = end
+    # Merge neighbouring runs pairwise until one remains.
+    while len(bounds) > 2:
+        runs = len(bounds) - 1
+        merged = [lo]
+        for k in _range(0, runs - 1, 2):
+            _merge_decreasing(arr, bounds[k], bounds[k + 1], bounds[k + 2], buffer_size)
+            merged.append(bounds[k + 2])
+        if runs % 2:
+            merged.append(hi)
+        bounds = merged
+    return arr
+
+
+def _ciura_gaps(n):
+    # Ciura's empirically best gaps, extended geometrically by 2.25.
+    gaps = [1, 4, 10, 23, 57, 132, 301, 701, 1750]
+    while gaps[-1] < n:
+        gaps.append(gaps[-1] * 9 // 4)
+    return gaps
+
+
+def _tokuda_gaps(n):
+    # ceil((9**k - 4**k) / (5 * 4**(k - 1))) for k = 1, 2, ...
+    gaps = []
+    k = 1
+    while not gaps or gaps[-1] < n:
+        gaps.append(-(-(9**k - 4**k) // (5 * 4**(k - 1))))
+        k += 1
+    return gaps
+
+
+def _sedgewick_gaps(n):
+    # Sedgewick (1982): 1, then 4**k + 3 * 2**(k - 1) + 1 for k = 1, 2, ...
+    gaps = [1]
+    k = 1
+    while gaps[-1] < n:
+        gaps.append(4**k + 3 * 2**(k - 1) + 1)
+        k += 1
+    return gaps
+
+
+GAP_SEQUENCES = {
+    "ciura": _ciura_gaps,
+    "tokuda": _tokuda_gaps,
+    "sedgewick": _sedgewick_gaps,
+}
+DEFAULT_GAP_SEQUENCE = "sedgewick"
+
+
+def _shell_gaps(gaps, n):
+    # Decreasing gaps below n for a sequence name or a callable returning an
+    # increasing sequence that starts at 1.
+    if callable(gaps):
+        sequence = gaps(n)
+    else:
+        try:
+            sequence = GAP_SEQUENCES[gaps](n)
+        except (KeyError, TypeError):
+            raise ValueError(
+                f"Unknown gap sequence {gaps!r}; expected one of {sorted(GAP_SEQUENCES)} or a callable"
+            ) from None
+    sequence = [gap for gap in sequence if gap < n]
+    if sequence and sequence[0] != 1:
+        raise ValueError(f"gap sequence must start at 1, got {sequence[:3]}")
+    return sequence[::-1]
+
+
+def _gapped_insertion(arr, lo, hi, gap):
+    # The linear insertion kernel run over the gap interleaved subsequences.
+    for i in range(lo + gap, hi):
+        current_element = arr[i]
+        j = i - gap
+        while j >= lo and arr[j] < current_element:
+            arr[j + gap] = arr[j]
+            j -= gap
+        arr[j + gap] = current_element
+
+
+def _shell_sort(arr, lo=0, hi=None, gaps=DEFAULT_GAP_SEQUENCE, _range=range):
+    # Not stable: gapped passes can reorder equal elements.
+    if hi is None:
+        hi = len(arr)
+    sequence = _shell_gaps(gaps, hi - lo)
+    if _leading_run(arr, lo, hi) == hi:
+        return arr
+    for k in _range(len(sequence)):
+        gap = sequence[k]
+        if gap == 1:
+            _linear_insertion(arr, lo, hi)
+        else:
+            _gapped_insertion(arr, lo, hi, gap)
+    return arr
+
+
+DEFAULT_LIBRARY_EPSILON = 1.0
+_EMPTY = object()
+
+
+def _library_insert(slots, v, i):
+    # Places (v, i) after every entry that precedes it in decreasing stable
+    # order: larger values, and equal values from earlier input positions.
+    # Binary search probes the first entry at or after mid; when no gap is
+    # free at the insertion point, entries shift toward the nearest gap.
+    m = len(slots)
+    lo = 0
+    hi = m
+    while lo < hi:
+        mid = (lo + hi) // 2
+        p = mid
+        while p < hi and slots[p] is _EMPTY:
+            p += 1
+        if p == hi:
+            hi = mid
+            continue
+        w, j = slots[p]
+        if w < v or (i < j and not v < w):
+            hi = mid
+        else:
+            lo = p + 1
+    if lo < m and slots[lo] is _EMPTY:
+        slots[lo] = (v, i)
+        return
+    e = lo
+    while e < m and slots[e] is not _EMPTY:
+        e += 1
+    if e < m:
+        slots[lo + 1:e + 1] = slots[lo:e]
+        slots[lo] = (v, i)
+        return
+    e = lo - 1
+    while slots[e] is not _EMPTY:
+        e -= 1
+    slots[e:lo - 1] = slots[e + 1:lo]
+    slots[lo - 1] = (v, i)
+
+
+def _library_sort(arr, lo=0, hi=None, epsilon=DEFAULT_LIBRARY_EPSILON, _range=range):
+    # Library sort (Bender, Farach-Colton and Mosteiro): insertion sort into
+    # an array with (1 + epsilon) slots per element, respread evenly each
+    # time the element count doubles. Elements are inserted in a seeded
+    # random order, which is what makes the gaps absorb inserts in expected
+    # O(n log n) time; ties break on input position to keep the sort stable.
+    if hi is None:
+        hi = len(arr)
+    if epsilon <= 0:
+        raise ValueError(f"epsilon must be positive, got {epsilon}")
+    if _leading_run(arr, lo, hi) == hi:
+        return arr
+    order = list(range(lo, hi))
+    random.Random(hi - lo).shuffle(order)
+    slots = [(arr[order[0]], order[0])]
+    placed = 1
+    for k in _range(1, hi - lo):
+        if (placed & (placed - 1)) == 0:
+            items = [entry for entry in slots if entry is not _EMPTY]
+            size = int((1 + epsilon) * min(2 * placed, hi - lo)) + 1
+            slots = [_EMPTY] * size
+            for j, entry in enumerate(items):
+                slots[j * size // placed] = entry
+        i = order[k]
+        _library_insert(slots, arr[i], i)
+        placed += 1
+    k = lo
+    for entry in slots:
+        if entry is not _EMPTY:
+            arr[k] = entry[0]
+            k += 1
+    return arr
+
+
+_STRATEGIES = {
+    "linear": _linear_insertion,
+    "binary": _binary_insertion,
+    "hybrid": _hybrid_sort,
+    "shell": _shell_sort,
+    "library": _library_sort,
+}
+
+
+def _get_strategy(strategy):
+    try:
+        return _STRATEGIES[strategy]
+    except (KeyError, TypeError):
+        raise ValueError(
+            f"Unknown strategy {strategy!r}; expected one of {sorted(_STRATEGIES)}"
+        ) from None
+
+
+_INT64_MIN = -2**63
+_INT64_MAX = 2**63 - 1
+_FLOAT_EXACT_INT = 2**53
+_NAN_POSITIONS = ("first", "last")
+_BACKENDS = ("python", "numpy", "auto", "radix", "integer")
+# "integer" is the original name of the radix backend, kept as an alias.
+_RADIX_BACKENDS = ("radix", "integer")
+
+
+def _numeric_kind(arr):
+    # "q" for a list of only ints that fit int64, "d" for a list of only
+    # floats, "mixed" for floats mixed with ints that float64 holds exactly
+    # (|x| <= 2**53); None for anything else, including bools. An empty list
+    # is "d", the dtype NumPy gives it.
+    if type(arr) is not list:
+        return None
+    types = set(map(type, arr))
+    if types <= {float}:
+        return "d"
+    if types == {int}:
+        return "q" if min(arr) >= _INT64_MIN and max(arr) <= _INT64_MAX else None
+    if types == {int, float} and all(
+        -_FLOAT_EXACT_INT <= x <= _FLOAT_EXACT_INT for x in arr if type(x) is int
+    ):
+        return "mixed"
+    return None
+
+
+def _numeric_typecode(arr, promote=False):
+    # array typecode for a list accepted by _numeric_kind; an int/float mix
+    # is packed as "d" only with promote.
+    kind = _numeric_kind(arr)
+    if kind == "mixed":
+        return "d" if promote else None
+    return kind
+
+
+def _numeric_dtype(arr):
+    # dtype NumPy can sort the input with, or None if it is neither a 1-D
+    # ndarray of ints/floats nor a list accepted by _numeric_kind. An
+    # int/float mix gets the builtin float, which NumPy reads as float64; it
+    # tells _numpy_sort to hand back the original objects so ints stay ints.
+    if isinstance(arr, np.ndarray):
+        if arr.ndim == 1 and arr.dtype.kind in "iuf":
+            return arr.dtype
+        return None
+    kind = _numeric_kind(arr)
+    if kind is None:
+        return None
+    return {"q": np.int64, "d": np.float64, "mixed": float}[kind]
+
+
+def _numpy_argsort_decreasing(values, nan_position="last"):
+    # A stable ascending argsort of the reversed array, read backwards, is a
+    # stable decreasing argsort. NumPy sorts NaNs last in ascending order, so
+    # they come out first here, still in their original relative order.
+    n = len(values)
+    order = (n - 1) - np.argsort(values[::-1], kind="stable")[::-1]
+    if values.dtype.kind == "f":
+        # 0.0 and -0.0 compare equal, so they form one run of ties. Split it
+        # like the float total order does: 0.0 first, each sign in input order.
+        negative_zero = np.signbit(values) & (values == 0)
+        if negative_zero.any():
+            run = np.flatnonzero(values[order] == 0)
+            zeros = order[run]
+            signs = negative_zero[zeros]
+            order[run] = np.concatenate((zeros[~signs], zeros[signs]))
+    if nan_position == "last" and values.dtype.kind == "f":
+        nan_count = int(np.count_nonzero(np.isnan(values)))
+        if nan_count:
+            order = np.concatenate((order[nan_count:], order[:nan_count]))
+    return order
+
+
+def _numpy_sort(arr, dtype, nan_position):
+    if nan_position not in _NAN_POSITIONS:
+        raise ValueError(f"nan_position must be one of {_NAN_POSITIONS}, got {nan_position!r}")
+    if isinstance(arr, np.ndarray):
+        return arr[_numpy_argsort_decreasing(arr, nan_position)]
+    values = np.array(arr, dtype=dtype)
+    order = _numpy_argsort_decreasing(values, nan_position)
+    if dtype is float:
+        return [arr[i] for i in order.tolist()]
+    return values[order].tolist()
+
+
+def numpy_sort_decreasing(arr, nan_position="last"):
+    if np is None:
+        raise ImportError("numpy_sort_decreasing requires NumPy")
+    dtype = _numeric_dtype(arr)
+    if dtype is None:
+        raise TypeError(
+            "numpy_sort_decreasing expects a 1-D numeric ndarray or a list of ints and floats"
+        )
+    return _numpy_sort(arr, dtype, nan_position)
+
+
+def _numpy_dtype_for(arr, backend):
+    if backend == "python" or backend in _RADIX_BACKENDS:
+        return None
+    if backend == "numpy":
+        if np is None:
+            raise ImportError("backend='numpy' requires NumPy")
+        dtype = _numeric_dtype(arr)
+        if dtype is None:
+            raise TypeError("backend='numpy' requires numeric input")
+        return dtype
+    if backend == "auto":
+        return None if np is None else _numeric_dtype(arr)
+    raise ValueError(f"Unknown backend {backend!r}; expected one of {_BACKENDS}")
+
+
+# Counting sort while max - min < COUNTING_RANGE_FACTOR * n, LSD radix sort
+# with digits of at most RADIX_BITS bits otherwise.
+COUNTING_RANGE_FACTOR = 4
+RADIX_BITS = 11
+
+
+def _integer_bounds(arr, backend):
+    # (min, max) of a list of only ints within int64 or a non-empty
+    # array('q') that the backend sends down the integer path, else None.
+    # "auto" prefers NumPy over the pure Python radix sort, which only wins
+    # while counting sort applies.
+    if backend not in _RADIX_BACKENDS and backend != "auto":
+        return None
+    if isinstance(arr, array):
+        if arr.typecode != "q" or not arr:
+            return None
+    elif type(arr) is not list or not arr or set(map(type, arr)) != {int}:
+        return None
+    lo = min(arr)
+    hi = max(arr)
+    if lo < _INT64_MIN or hi > _INT64_MAX:
+        return None
+    if backend == "auto" and np is not None and hi - lo >= COUNTING_RANGE_FACTOR * len(arr):
+        return None
+    return lo, hi
+
+
+def _radix_digits(span, n):
+    # (bits per digit, passes) covering keys in [0, span]. A small span is one
+    # bucket pass, i.e. a counting sort; otherwise the passes are balanced,
+    # with no more buckets per pass than about n.
+    width = span.bit_length()
+    if span < COUNTING_RANGE_FACTOR * n:
+        return width, 1
+    passes = -(-width // min(RADIX_BITS, n.bit_length()))
+    return -(-width // passes), passes
+
+
+def _integer_sort(arr, lo, hi):
+    # Decreasing copy of arr in O(n + range) or O(n * passes), no comparisons.
+    n = len(arr)
+    span = hi - lo
+    if span < COUNTING_RANGE_FACTOR * n:
+        counts = [0] * (span + 1)
+        for value in arr:
+            counts[value - lo] += 1
+        result = []
+        for offset in range(span, -1, -1):
+            count = counts[offset]
+            if count:
+                result.extend(repeat(lo + offset, count))
+        return result
+    bits, passes = _radix_digits(span, n)
+    mask = (1 << bits) - 1
+    values = arr
+    for shift in range(0, bits * passes, bits):
+        buckets = [[] for _ in range(mask + 1)]
+        for value in values:
+            buckets[(value - lo) >> shift & mask].append(value)
+        # Emptying buckets from the top down makes every pass decreasing.
+        values = list(chain.from_iterable(reversed(buckets)))
+    return values
+
+
+def _integer_argsort(keys, lo, hi):
+    # Stable decreasing permutation of integer keys: LSD radix over positions.
+    bits, passes = _radix_digits(hi - lo, len(keys))
+    mask = (1 << bits) - 1
+    order = range(len(keys))
+    for p in range(passes):
+        shift = p * bits
+        buckets = [[] for _ in range(mask + 1)]
+        for i in order:
+            buckets[(keys[i] - lo) >> shift & mask].append(i)
+        order = list(chain.from_iterable(reversed(buckets)))
+    return order
+
+
+_FLOAT_MAGNITUDE = (1 << 63) - 1
+_FLOAT_INF_BITS = 0x7FF0000000000000
+
+
+def _use_float_keys(arr, backend):
+    # True for a list of floats (optionally mixed with ints that float64 holds
+    # exactly), an array('d') or a 1-D "d" memoryview that the backend sends
+    # down the float key path. "auto" prefers NumPy for lists.
+    if backend not in _RADIX_BACKENDS and backend != "auto":
+        return False
+    if isinstance(arr, array):
+        return arr.typecode == "d"
+    if type(arr) is memoryview:
+        return arr.ndim == 1 and arr.format.lstrip("@") == "d"
+    if _numeric_typecode(arr, promote=True) != "d":
+        return False
+    return backend in _RADIX_BACKENDS or np is None
+
+
+def _float_keys(values):
+    # Order-preserving int64 keys for IEEE-754 doubles. A non-negative double's
+    # bit pattern already sorts like the value; a negative one sorts backwards,
+    # so its magnitude bits are flipped. That puts -0.0 just below +0.0, and
+    # every NaN, whatever its sign or payload, maps below -inf.
+    bits = array("q")
+    bits.frombytes(array("d", values).tobytes())
+    return [
+        _INT64_MIN if b & _FLOAT_MAGNITUDE > _FLOAT_INF_BITS
+        else b if b >= 0 else b ^ _FLOAT_MAGNITUDE
+        for b in bits
+    ]
+
+
+def _float_argsort(values):
+    # Stable decreasing permutation in the IEEE total order with NaNs last.
+    keys = _float_keys(values)
+    if not keys:
+        return []
+    return _integer_argsort(keys, min(keys), max(keys))
+
+
+def _radix_sorted(arr, backend):
+    # Sorted copy of arr from the integer or float key path, or None when arr
+    # does not qualify for either. Lists come back as lists, typed buffers as
+    # an array of the same item type.
+    bounds = _integer_bounds(arr, backend)
+    if bounds is not None:
+        result = _integer_sort(arr, *bounds)
+        return result if type(arr) is list else array("q", result)
+    if _use_float_keys(arr, backend):
+        result = [arr[i] for i in _float_argsort(arr)]
+        return result if type(arr) is list else array("d", result)
+    return None
+
+
+class _PositionedKey:
+    # A key tagged with its input position. Equal keys order by position, the
+    # earlier one larger, so any decreasing sort keeps them in input order.
+    # Uses only <, like the engines: a tuple would test keys with == first.
+    __slots__ = ("key", "position")
+
+    def __init__(self, key, position):
+        self.key = key
+        self.position = position
+
+    def __lt__(self, other):
+        if self.key < other.key:
+            return True
+        return not other.key < self.key and self.position > other.position
+
+
+def _argsort_keys(keys, sort, backend):
+    # Stable decreasing permutation of keys. Each key is paired with its
+    # position, so equal keys order by position and the elements themselves
+    # are never compared.
+    bounds = _integer_bounds(keys, backend)
+    if bounds is not None:
+        return _integer_argsort(keys, *bounds)
+    if _use_float_keys(keys, backend):
+        return _float_argsort(keys)
+    dtype = _numpy_dtype_for(keys, backend)
+    if dtype is not None:
+        return _numpy_argsort_decreasing(np.array(keys, dtype=dtype)).tolist()
+    decorated = list(map(_PositionedKey, keys, range(len(keys))))
+    sort(decorated, 0, len(decorated))
+    return [entry.position for entry in decorated]
+
+
+def _permute_inplace(arr, perm):
+    # arr[k] = arr[perm[k]] for every k, following the permutation's cycles
+    # so only one element is held aside at a time. perm is consumed.
+    for start in range(len(perm)):
+        src = perm[start]
+        if src == start:
+            continue
+        held = arr[start]
+        k = start
+        while src != start:
+            arr[k] = arr[src]
+            perm[k] = k
+            k = src
+            src = perm[k]
+        arr[k] = held
+        perm[k] = k
+    return arr
+
+
+def insertion_sort_decreasing(arr, strategy="linear", backend="python", key=None):
+    sort = _get_strategy(strategy)
+    if key is not None:
+        perm = _argsort_keys(list(map(key, arr)), sort, backend)
+        if np is not None and isinstance(arr, np.ndarray):
+            return arr[perm]
+        return [arr[i] for i in perm]
+    result = _radix_sorted(arr, backend)
+    if result is not None:
+        return result
+    dtype = _numpy_dtype_for(arr, backend)
+    if dtype is not None:
+        return _numpy_sort(arr, dtype, "last")
+    sorted_arr = arr.copy()
+    sort(sorted_arr, 0, len(sorted_arr))
+    return sorted_arr
+
+
+def argsort_decreasing(arr, key=None, strategy="hybrid", backend="python"):
+    # Stable permutation perm with arr[perm[0]], arr[perm[1]], ... decreasing.
+    # Only the keys are sorted (paired with positions), never the elements.
+    sort = _get_strategy(strategy)
+    keys = arr if key is None else list(map(key, arr))
+    perm = _argsort_keys(keys, sort, backend)
+    if np is not None and isinstance(arr, np.ndarray):
+        return np.array(perm, dtype=np.intp)
+    return array("q", perm)
+
+
+def apply_permutation(perm, *sequences, inplace=False):
+    # Reorders every sequence by perm: result[k] = seq[perm[k]]. ndarrays are
+    # gathered with fancy indexing, array.array keeps its typecode and other
+    # sequences come back as lists. With inplace=True each sequence is
+    # permuted cycle by cycle and returned.
+    n = len(perm)
+    for seq in sequences:
+        if len(seq) != n:
+            raise ValueError(f"sequence of length {len(seq)} does not match permutation of length {n}")
+    results = []
+    for seq in sequences:
+        if inplace:
+            results.append(_permute_inplace(seq, list(perm)))
+        elif np is not None and isinstance(seq, np.ndarray):
+            results.append(seq[np.asarray(perm, dtype=np.intp)])
+        elif isinstance(seq, array):
+            results.append(array(seq.typecode, map(seq.__getitem__, perm)))
+        else:
+            results.append(list(map(seq.__getitem__, perm)))
+    return results
+
+
+_DIRECTIONS = ("desc", "asc")
+
+
+def _record_columns(data, names, backend):
+    # One column per sort field, extracted once. int64-range ints and floats
+    # are packed in the form the backend's fast path reads directly: ndarrays
+    # when NumPy sorts them, typed arrays for the integer and float key paths.
+    # The comparison engines of backend="python" get plain lists.
+    if isinstance(data, dict):
+        lengths = {len(column) for column in data.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"columns must all have the same length, got {sorted(lengths)}")
+        columns = [list(data[name]) for name in names]
+    else:
+        getter = itemgetter if data and isinstance(data[0], dict) else attrgetter
+        columns = [list(map(getter(name), data)) for name in names]
+    if backend == "python":
+        return columns
+    packed_numpy = np is not None and backend not in _RADIX_BACKENDS
+    typed = []
+    for column in columns:
+        typecode = _numeric_typecode(column)
+        if typecode is None:
+            typed.append(column)
+        elif packed_numpy:
+            typed.append(np.array(column, dtype=_numeric_dtype(column)))
+        else:
+            typed.append(array(typecode, column))
+    return typed
+
+
+def sort_records_decreasing(data, fields, strategy="hybrid", backend="auto"):
+    # Sorts a list of records (dicts or objects with attributes) or a dict of
+    # equal-length columns by several fields. Each field is a name (sorted
+    # decreasing) or a (name, "desc" | "asc") pair; earlier fields take
+    # precedence. Stable LSD order: one stable argsort per field, last first.
+    sort = _get_strategy(strategy)
+    spec = []
+    for field in fields:
+        name, direction = field if isinstance(field, tuple) else (field, "desc")
+        if direction not in _DIRECTIONS:
+            raise ValueError(f"direction must be one of {_DIRECTIONS}, got {direction!r}")
+        spec.append((name, direction))
+    if not spec:
+        raise ValueError("at least one sort field is required")
+    columns = _record_columns(data, [name for name, _ in spec], backend)
+    n = len(columns[0])
+    perm = list(range(n))
+    for column, (_, direction) in zip(reversed(columns), reversed(spec)):
+        # Gathering keeps typed columns typed, so every pass stays on the
+        # backend's fast path instead of boxing the keys back into a list.
+        keys, = apply_permutation(perm, column)
+        if direction == "desc":
+            order = _argsort_keys(keys, sort, backend)
+        else:
+            # A stable decreasing argsort of the reversed keys, read backwards,
+            # is a stable ascending argsort.
+            order = [n - 1 - i for i in reversed(_argsort_keys(keys[::-1], sort, backend))]
+        perm = list(map(perm.__getitem__, order))
+    if isinstance(data, dict):
+        return dict(zip(data, apply_permutation(perm, *data.values())))
+    return list(map(data.__getitem__, perm))
+
+
+# Native item formats shared by memoryview and array.array
+_BUFFER_FORMATS = frozenset("bBhHiIlLqQfd")
+
+
+def _check_sortable_buffer(arr):
+    # array.array, bytearray and memoryview are sorted directly in their typed
+    # storage: the engines only index and slice-assign, which all three support
+    # without boxing the whole buffer into a list.
+    if type(arr) is not memoryview:
+        return
+    if arr.readonly:
+        raise TypeError("cannot sort a read-only memoryview in place")
+    if arr.ndim != 1:
+        raise TypeError(f"only 1-D memoryviews can be sorted in place, got ndim={arr.ndim}")
+    if arr.format.lstrip("@") not in _BUFFER_FORMATS:
+        raise TypeError(f"unsupported memoryview format {arr.format!r}")
+
+
+def insertion_sort_decreasing_inplace(arr, strategy="linear", backend="python", key=None):
+    sort = _get_strategy(strategy)
+    if isinstance(arr, (array, bytearray, memoryview)):
+        _check_sortable_buffer(arr)
+    if key is not None:
+        return _permute_inplace(arr, _argsort_keys(list(map(key, arr)), sort, backend))
+    result = _radix_sorted(arr, backend)
+    if result is not None:
+        arr[:] = result
+        return arr
+    dtype = _numpy_dtype_for(arr, backend)
+    if dtype is not None:
+        arr[:] = _numpy_sort(arr, dtype, "last")
+        return arr
+    sort(arr, 0, len(arr))
+    return arr
+
+
+def hybrid_sort_decreasing(arr, cutoff=DEFAULT_CUTOFF):
+    sorted_arr = arr.copy()
+    return _hybrid_sort(sorted_arr, 0, len(sorted_arr), cutoff)
+
+
+def hybrid_sort_decreasing_inplace(arr, cutoff=DEFAULT_CUTOFF, buffer_size=DEFAULT_MERGE_BUFFER):
+    return _hybrid_sort(arr, 0, len(arr), cutoff, buffer_size)
+
+
+def _pack_list_rows(rows):
+    # One 2-D array of equal-length, non-empty list rows that hold only floats
+    # or only int64-range ints, else None. The group costs one type scan and
+    # one conversion instead of a classification per row.
+    types = set(map(type, chain.from_iterable(rows)))
+    if types == {float}:
+        return np.array(rows, dtype=np.float64)
+    if types == {int}:
+        try:
+            return np.array(rows, dtype=np.int64)
+        except OverflowError:
+            return None
+    return None
+
+
+def _numpy_sort_rows(values):
+    # Stable decreasing sort of every row of a 2-D array with NaNs last: a
+    # stable ascending sort of the negated values. Integers are negated with ~,
+    # which is order-reversing and cannot overflow.
+    if values.dtype.kind in "iu":
+        order = np.argsort(~values, axis=1, kind="stable")
+    else:
+        negative_zero = np.signbit(values) & (values == 0)
+        if negative_zero.any():
+            # Ties between 0.0 and -0.0 go to 0.0, as in the float total
+            # order. Only -0.0 is marked, so NaNs of either sign keep their
+            # input order.
+            order = np.lexsort((negative_zero, -values), axis=1)
+        else:
+            order = np.argsort(-values, axis=1, kind="stable")
+    return np.take_along_axis(values, order, axis=1)
+
+
+def sort_many_decreasing(arrays, strategy="linear", backend="python", inplace=False):
+    # Sorts every sequence in arrays, resolving strategy and backend once for
+    # the whole batch. With the numpy/auto backend, numeric rows of equal
+    # length and dtype are packed into one 2-D array and sorted in one call.
+    sort = _get_strategy(strategy)
+    rows = list(arrays)
+    out = rows if inplace else rows.copy()
+    pending = range(len(rows))
+    if backend != "python":
+        packed = []
+        others = []
+        if np is not None and (backend == "numpy" or backend == "auto"):
+            # List rows are classified a whole length group at a time; a group
+            # that does not pack as one falls back to per-row classification.
+            by_length = {}
+            for index, row in enumerate(rows):
+                if type(row) is list and row:
+                    by_length.setdefault(len(row), []).append(index)
+                else:
+                    others.append(index)
+            for indices in by_length.values():
+                values = _pack_list_rows([rows[k] for k in indices])
+                if values is None:
+                    others.extend(indices)
+                else:
+                    packed.append((indices, values, False))
+        else:
+            others = range(len(rows))
+        groups = {}
+        pending = []
+        for index in others:
+            row = rows[index]
+            dtype = _numpy_dtype_for(row, backend) if len(row) else None
+            # Packed rows come back as floats, so int/float mixes stay apart.
+            if dtype is None or dtype is float:
+                pending.append(index)
+            else:
+                is_ndarray = isinstance(row, np.ndarray)
+                groups.setdefault((len(row), np.dtype(dtype), is_ndarray), []).append(index)
+        for (_, dtype, is_ndarray), indices in groups.items():
+            packed.append((indices, np.array([rows[k] for k in indices], dtype=dtype), is_ndarray))
+        for indices, values, is_ndarray in packed:
+            result = _numpy_sort_rows(values)
+            if not is_ndarray:
+                result = result.tolist()
+            for k, values in zip(indices, result):
+                if inplace:
+                    rows[k][:] = values
+                else:
+                    out[k] = values
+    for k in pending:
+        row = rows[k] if inplace else rows[k].copy()
+        result = _radix_sorted(row, backend)
+        if result is None:
+            sort(row, 0, len(row))
+        else:
+            row[:] = result
+        out[k] = row
+    return out
+
+
+def shell_sort_decreasing_inplace(arr, gaps=DEFAULT_GAP_SEQUENCE):
+    if isinstance(arr, (array, bytearray, memoryview)):
+        _check_sortable_buffer(arr)
+    return _shell_sort(arr, 0, len(arr), gaps)
+
+
+def library_sort_decreasing_inplace(arr, epsilon=DEFAULT_LIBRARY_EPSILON):
+    if isinstance(arr, (array, bytearray, memoryview)):
+        _check_sortable_buffer(arr)
+    return _library_sort(arr, 0, len(arr), epsilon)
+
+
+def top_k_decreasing(arr, k):
+    if k < 0:
+        raise ValueError(f"k must be non-negative, got {k}")
+    window = []
+    if k == 0:
+        return window
+    values = iter(arr)
+    # Fill the window with the first k values, then only admit values that
+    # beat its current minimum. A value equal to the minimum is rejected, so
+    # ties keep the order of the full stable sort.
+    for value in values:
+        window.insert(_bisect_decreasing(window, value, 0, len(window)), value)
+        if len(window) == k:
+            break
+    else:
+        return window
+    smallest = window[-1]
+    for value in values:
+        if smallest < value:
+            window.insert(_bisect_decreasing(window, value, 0, k - 1), value)
+            window.pop()
+            smallest = window[-1]
+    return window
+
+
+class _MaxHeapEntry:
+    # heapq pops its smallest entry first, so an entry is "smaller" when it
+    # holds the larger value or, on a tie, the earlier position. Uses only <.
+    __slots__ = ("value", "index")
+
+    def __init__(self, value, index):
+        self.value = value
+        self.index = index
+
+    def __lt__(self, other):
+        if other.value < self.value:
+            return True
+        return not self.value < other.value and self.index < other.index
+
+
+def iter_decreasing(iterable):
+    # Yields the elements in the order insertion_sort_decreasing would return
+    # them: O(n) heapify on the first request, then O(log n) per element.
+    values = list(iterable)
+    if values and set(map(type, values)) <= {int, float}:
+        # Plain numbers: negated (value, position) tuples compare in C.
+        heap = [(-value, index) for index, value in enumerate(values)]
+        heapq.heapify(heap)
+        while heap:
+            yield values[heapq.heappop(heap)[1]]
+    else:
+        heap = list(map(_MaxHeapEntry, values, range(len(values))))
+        heapq.heapify(heap)
+        while heap:
+            yield heapq.heappop(heap).value
+
+
+def _shift_block(arr, src, dst, length, chunk):
+    # Moves arr[src:src + length] to start at dst, chunk elements at a time,
+    # in the direction that never overwrites elements still to be moved.
+    if src > dst:
+        for offset in range(0, length, chunk):
+            size = min(chunk, length - offset)
+            arr[dst + offset:dst + offset + size] = _copy_slice(arr, src + offset, src + offset + size)
+    elif src < dst:
+        for end in range(length, 0, -chunk):
+            size = min(chunk, end)
+            arr[dst + end - size:dst + end] = _copy_slice(arr, src + end - size, src + end)
+
+
+def resort_decreasing_inplace(arr, dirty=(), tail_start=None):
+    # Restores decreasing order after arr[k] changed for every k in dirty
+    # and/or values were appended from tail_start on; every other element must
+    # still be in order. The result equals insertion_sort_decreasing(arr):
+    # ties between old and new elements keep their index order.
+    n = len(arr)
+    if tail_start is None:
+        tail_start = n
+    if not 0 <= tail_start <= n:
+        raise IndexError(f"tail_start {tail_start} out of range for length {n}")
+    positions = set(dirty)
+    for index in positions:
+        if not 0 <= index < n:
+            raise IndexError(f"dirty index {index} out of range for length {n}")
+    positions.update(range(tail_start, n))
+    positions = sorted(positions)
+    m = len(positions)
+    if not m:
+        return arr
+
+    # Pull the new values out and order them stably: O(m log m).
+    values = [arr[index] for index in positions]
+    order = _argsort_keys(values, _hybrid_sort, "python")
+    # Clean element q (0-based, in order) sits at q + bisect_right(shifted, q).
+    shifted = [index - k for k, index in enumerate(positions)]
+    clean = n - m
+
+    # ranks[i]: clean elements that precede the i-th new value. Each search is
+    # O(log n) probes and ranks are non-decreasing, so searches resume at the
+    # previous rank.
+    ranks = []
+    lo = 0
+    for i in order:
+        value = values[i]
+        position = positions[i]
+        hi = clean
+        while lo < hi:
+            q = (lo + hi) // 2
+            x = q + bisect_right(shifted, q)
+            if value < arr[x] or (not arr[x] < value and x < position):
+                lo = q + 1
+            else:
+                hi = q
+        ranks.append(lo)
+
+    # Clean elements move in segments of constant displacement, which only
+    # changes where a new value leaves or enters. Left shifts run left to
+    # right and right shifts right to left, so no source is overwritten.
+    breaks = sorted({0, clean, *(q for q in shifted if q < clean), *ranks})
+    left_moves = []
+    right_moves = []
+    for start, stop in zip(breaks, breaks[1:]):
+        src = start + bisect_right(shifted, start)
+        dst = start + bisect_right(ranks, start)
+        if src > dst:
+            left_moves.append((src, dst, stop - start))
+        elif src < dst:
+            right_moves.append((src, dst, stop - start))
+    for src, dst, length in left_moves:
+        _shift_block(arr, src, dst, length, DEFAULT_MERGE_BUFFER)
+    for src, dst, length in reversed(right_moves):
+        _shift_block(arr, src, dst, length, DEFAULT_MERGE_BUFFER)
+    for k, i in enumerate(order):
+        arr[ranks[k] + k] = values[i]
+    return arr
+
+
+@dataclass
+class SortStats:
+    strategy: str
+    n: int
+    comparisons: int = 0
+    moves: int = 0
+    inversions: int = 0
+    outer_iterations: int = 0
+    wall_time: float = 0.0
+    peak_extra_memory: int = 0
+
+
+class _CountedItem:
+    __slots__ = ("value", "stats")
+
+    def __init__(self, value, stats):
+        self.value = value
+        self.stats = stats
+
+    def __lt__(self, other):
+        self.stats.comparisons += 1
+        return self.value < other.value
+
+
+class _CountingList(list):
+    # Counts every element written into the sequence being sorted. Slices
+    # arrive as a list or, from _copy_slice, an array, so they are counted
+    # with len() and passed through without a copy of their own.
+    __slots__ = ("stats",)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self.stats.moves += len(value)
+        else:
+            self.stats.moves += 1
+        super().__setitem__(index, value)
+
+
+def _count_inversions(values):
+    # Pairs i < j with values[i] < values[j], i.e. pairs out of decreasing
+    # order, counted with a bottom-up merge sort on a scratch copy.
+    values = list(values)
+    n = len(values)
+    inversions = 0
+    width = 1
+    while width < n:
+        for lo in range(0, n - width, 2 * width):
+            mid = lo + width
+            hi = min(lo + 2 * width, n)
+            left = values[lo:mid]
+            i = 0
+            j = mid
+            k = lo
+            while i < width and j < hi:
+                if left[i] < values[j]:
+                    inversions += width - i
+                    values[k] = values[j]
+                    j += 1
+                else:
+                    values[k] = left[i]
+                    i += 1
+                k += 1
+            values[k:k + width - i] = left[i:]
+        width *= 2
+    return inversions
+
+
+def _observed_range(stats, callback):
+    def observed(*args):
+        for i in range(*args):
+            yield i
+            stats.outer_iterations += 1
+            if callback is not None:
+                callback(stats)
+    return observed
+
+
+def sort_with_stats(arr, strategy="linear", inplace=False, callback=None, trace_memory=True):
+    # Sorts like insertion_sort_decreasing(_inplace) and returns
+    # (result, SortStats). wall_time comes from a plain run of the engine; the
+    # counts come from a second run over counting proxies, during which
+    # callback(stats) fires once per outer iteration of the engine.
+    sort = _get_strategy(strategy)
+    if inplace and isinstance(arr, (array, bytearray, memoryview)):
+        _check_sortable_buffer(arr)
+    stats = SortStats(strategy, len(arr))
+    stats.inversions = _count_inversions(arr)
+
+    result = list(arr)
+    start_time = time.perf_counter()
+    sort(result, 0, len(result))
+    stats.wall_time = time.perf_counter() - start_time
+
+    counted = _CountingList(_CountedItem(value, stats) for value in arr)
+    counted.stats = stats
+    tracing = trace_memory and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+    try:
+        if trace_memory:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        sort(counted, 0, len(counted), _range=_observed_range(stats, callback))
+        if trace_memory:
+            stats.peak_extra_memory = max(0, tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        if tracing:
+            tracemalloc.stop()
+
+    if inplace:
+        if isinstance(arr, array):
+            arr[:] = array(arr.typecode, result)
+        elif type(arr) is memoryview:
+            arr[:] = array(arr.format.lstrip("@"), result)
+        else:
+            arr[:] = result
+        result = arr
+    return result, stats
+
+
+PARALLEL_MIN_SIZE = 100000
+
+
+def _sort_chunk(chunk, strategy):
+    return _get_strategy(strategy)(chunk, 0, len(chunk))
+
+
+def _sort_shared_chunk(name, typecode, start, stop, strategy):
+    # Worker side of the shared-memory path: only the segment name and bounds
+    # cross the process boundary, the numbers stay in the shared buffer.
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        view = shm.buf.cast(typecode)
+        try:
+            chunk = view[start:stop].tolist()
+            _get_strategy(strategy)(chunk, 0, len(chunk))
+            view[start:stop] = array(typecode, chunk)
+        finally:
+            view.release()
+    finally:
+        shm.close()
+
+
+def _sort_runs_in_shared_memory(pool, arr, typecode, bounds, strategy):
+    values = array(typecode, arr)
+    shm = shared_memory.SharedMemory(create=True, size=len(values) * values.itemsize)
+    try:
+        view = shm.buf.cast(typecode)
+        try:
+            view[:len(values)] = values
+            del values
+            list(pool.map(
+                _sort_shared_chunk,
+                repeat(shm.name), repeat(typecode),
+                [start for start, _ in bounds], [stop for _, stop in bounds],
+                repeat(strategy),
+            ))
+            return [view[start:stop].tolist() for start, stop in bounds]
+        finally:
+            view.release()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def parallel_sort_decreasing(arr, workers=None, chunk_size=None, strategy="hybrid",
+                             min_size=PARALLEL_MIN_SIZE):
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    n = len(arr)
+    # Process startup dominates on small inputs; sort them serially.
+    if n == 0 or n < min_size or workers == 1:
+        return insertion_sort_decreasing(arr, strategy=strategy)
+    _get_strategy(strategy)
+    if chunk_size is None:
+        chunk_size = -(-n // workers)
+    bounds = [(start, min(start + chunk_size, n)) for start in range(0, n, chunk_size)]
+    typecode = _numeric_typecode(arr)
+    with ProcessPoolExecutor(max_workers=min(workers, len(bounds))) as pool:
+        if typecode is None:
+            runs = list(pool.map(
+                _sort_chunk, [arr[start:stop] for start, stop in bounds], repeat(strategy)
+            ))
+        else:
+            runs = _sort_runs_in_shared_memory(pool, arr, typecode, bounds, strategy)
+    # heapq.merge is stable: ties come from the earlier chunk first.
+    return list(heapq.merge(*runs, reverse=True))
+
+
+ASYNC_TIME_BUDGET = 0.005
+ASYNC_OFFLOAD_THRESHOLD = 100000
+_ASYNC_CHUNK = 4096
+
+
+def _merge_steps(arr, lo, mid, hi, chunk):
+    # _merge_low in slices of chunk output elements, yielding the next output
+    # index after each one. Closing the generator early writes the buffered
+    # left-run elements back into the gap, so arr stays a permutation.
+    if lo >= mid or mid >= hi or not arr[mid - 1] < arr[mid]:
+        return
+    lo = _bisect_decreasing(arr, arr[mid], lo, mid)
+    hi = _bisect_decreasing_left(arr, arr[mid - 1], mid, hi)
+    buf = _copy_slice(arr, lo, mid)
+    n = len(buf)
+    i = 0
+    j = mid
+    k = lo
+    try:
+        while i < n and j < hi:
+            stop = k + chunk
+            while i < n and j < hi and k < stop:
+                if buf[i] < arr[j]:
+                    arr[k] = arr[j]
+                    j += 1
+                else:
+                    arr[k] = buf[i]
+                    i += 1
+                k += 1
+            yield k
+    finally:
+        if i < n:
+            arr[k:k + n - i] = buf[i:]
+
+
+def _hybrid_steps(arr, cutoff, chunk):
+    # _hybrid_sort over all of arr as a generator that does a bounded amount of
+    # work between yields: one run of at most chunk elements, or one merge
+    # slice. Yields the number of elements processed so far.
+    hi = len(arr)
+    bounds = [0]
+    start = 0
+    while start < hi:
+        end = _leading_run(arr, start, min(start + chunk, hi))
+        if end - start < cutoff:
+            stop = min(start + cutoff, hi)
+            _binary_insert_tail(arr, start, end, stop)
+            end = stop
+        bounds.append(end)
+        start = end
+        yield start
+    done = hi
+    while len(bounds) > 2:
+        runs = len(bounds) - 1
+        merged = [0]
+        for k in range(0, runs - 1, 2):
+            lo, hi_ = bounds[k], bounds[k + 2]
+            for index in _merge_steps(arr, lo, bounds[k + 1], hi_, chunk):
+                yield done + index - lo
+            done += hi_ - lo
+            merged.append(hi_)
+        if runs % 2:
+            done += hi - bounds[-2]
+            merged.append(hi)
+        bounds = merged
+        yield done
+
+
+async def insertion_sort_decreasing_async(arr, inplace=False, time_budget=ASYNC_TIME_BUDGET,
+                                          progress=None, executor=None,
+                                          offload_threshold=ASYNC_OFFLOAD_THRESHOLD,
+                                          cutoff=DEFAULT_CUTOFF):
+    # Sorts with the hybrid engine without blocking the event loop: work runs
+    # in slices of about time_budget seconds with an await asyncio.sleep(0)
+    # between them. progress(fraction) is called after every slice and with
+    # 1.0 at the end. Inputs of at least offload_threshold elements are sorted
+    # in executor instead, when one is given.
+    if time_budget <= 0:
+        raise ValueError(f"time_budget must be positive, got {time_budget}")
+    if cutoff < 1:
+        raise ValueError(f"cutoff must be at least 1, got {cutoff}")
+    if executor is not None and len(arr) >= offload_threshold:
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(executor, hybrid_sort_decreasing, arr, cutoff)
+        if inplace:
+            arr[:] = result
+            result = arr
+        if progress is not None:
+            progress(1.0)
+        return result
+
+    work = arr if inplace else arr.copy()
+    n = len(work)
+    # Run formation plus one pass per merge level; natural runs can only
+    # shorten this, so the reported fraction never overshoots.
+    levels = (max(n - 1, 0) // cutoff).bit_length()
+    total = max(n * (1 + levels), 1)
+    steps = _hybrid_steps(work, cutoff, _ASYNC_CHUNK)
+    try:
+        deadline = time.perf_counter() + time_budget
+        for done in steps:
+            if time.perf_counter() >= deadline:
+                if progress is not None:
+                    progress(min(done / total, 1.0))
+                await asyncio.sleep(0)
+                deadline = time.perf_counter() + time_budget
+    finally:
+        # On cancellation this puts any elements held by an unfinished merge
+        # back, so an in-place input keeps all of its elements.
+        steps.close()
+    if progress is not None:
+        progress(1.0)
+    return work
+
+
+EXTERNAL_MEMORY_LIMIT = 256 * 2**20
+EXTERNAL_FAN_IN = 64
+# Rough cost of one element while a block is sorted as a Python list: the list
+# slot, the boxed number and the merge buffer.
+_BOXED_ITEM_BYTES = 64
+
+
+def _release_pages(mm, start, stop):
+    # Drop the pages of an already-processed mmap range so the file cache
+    # does not count against the memory budget.
+    if hasattr(mm, "madvise"):
+        start -= start % mmap.PAGESIZE
+        if stop > start:
+            mm.madvise(mmap.MADV_DONTNEED, start, stop - start)
+
+
+def _iter_run(path, typecode, buffer_items):
+    with open(path, "rb") as run:
+        while True:
+            block = array(typecode)
+            try:
+                block.fromfile(run, buffer_items)
+            except EOFError:
+                pass  # the short final read still lands in block
+            if not block:
+                return
+            yield from block
+
+
+def _write_stream(values, path, typecode, buffer_items):
+    written = 0
+    with open(path, "wb") as out:
+        block = array(typecode)
+        for value in values:
+            block.append(value)
+            if len(block) >= buffer_items:
+                block.tofile(out)
+                written += len(block)
+                del block[:]
+        block.tofile(out)
+        written += len(block)
+    return written * block.itemsize
+
+
+def external_sort_decreasing(input_path, output_path, memory_limit=EXTERNAL_MEMORY_LIMIT,
+                             typecode="q", strategy="hybrid", fan_in=EXTERNAL_FAN_IN,
+                             tmp_dir=None):
+    # Sorts a flat binary file of array(typecode) items. Pass 0 reads the input
+    # through mmap in memory-budgeted blocks and spills each sorted block as a
+    # run; later passes stream k-way merges of at most fan_in runs. Returns one
+    # dict per pass with the bytes it read and wrote.
+    sort = _get_strategy(strategy)
+    if os.path.abspath(input_path) == os.path.abspath(output_path):
+        raise ValueError("output_path must differ from input_path")
+    if fan_in < 2:
+        raise ValueError(f"fan_in must be at least 2, got {fan_in}")
+    itemsize = array(typecode).itemsize
+    file_size = os.path.getsize(input_path)
+    if file_size % itemsize:
+        raise ValueError(
+            f"{input_path} holds {file_size} bytes, not a whole number of {itemsize}-byte items"
+        )
+    block_items = memory_limit // (itemsize + _BOXED_ITEM_BYTES)
+    if block_items < 1:
+        raise ValueError(f"memory_limit of {memory_limit} bytes cannot hold a single item")
+    total_items = file_size // itemsize
+    passes = []
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as workdir:
+        runs = []
+        if total_items:
+            single_block = total_items <= block_items
+            with open(input_path, "rb") as source, \
+                    mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for start in range(0, total_items, block_items):
+                    stop = min(start + block_items, total_items)
+                    block = array(typecode)
+                    with memoryview(mm) as view:
+                        block.frombytes(view[start * itemsize:stop * itemsize])
+                    _release_pages(mm, start * itemsize, stop * itemsize)
+                    values = block.tolist()
+                    del block
+                    sort(values, 0, len(values))
+                    path = output_path if single_block else os.path.join(workdir, f"run-0-{len(runs)}")
+                    with open(path, "wb") as out:
+                        array(typecode, values).tofile(out)
+                    del values
+                    runs.append(path)
+        else:
+            open(output_path, "wb").close()
+        passes.append({
+            "pass": 0, "runs_in": 1, "runs_out": len(runs),
+            "bytes_read": file_size, "bytes_written": file_size,
+        })
+        if len(runs) <= 1:
+            return passes
+
+        # Each run being merged, plus the output, gets an equal read buffer.
+        buffer_items = max(1, memory_limit // (2 * itemsize * (fan_in + 1)))
+        pass_number = 0
+        while len(runs) > 1:
+            pass_number += 1
+            final = len(runs) <= fan_in
+            merged_runs = []
+            bytes_written = 0
+            for group_start in range(0, len(runs), fan_in):
+                group = runs[group_start:group_start + fan_in]
+                if final:
+                    path = output_path
+                else:
+                    path = os.path.join(workdir, f"run-{pass_number}-{len(merged_runs)}")
+                merged = heapq.merge(
+                    *(_iter_run(run, typecode, buffer_items) for run in group), reverse=True
+                )
+                bytes_written += _write_stream(merged, path, typecode, buffer_items)
+                for run in group:
+                    os.remove(run)
+                merged_runs.append(path)
+            passes.append({
+                "pass": pass_number, "runs_in": len(runs), "runs_out": len(merged_runs),
+                "bytes_read": file_size, "bytes_written": bytes_written,
+            })
+            runs = merged_runs
+    return passes
+
+
+DEFAULT_BLOCK_SIZE = 1000
+
+
+class SortedDescending:
+    # Values are kept in decreasing order across a list of blocks, each one a
+    # sorted list of at most 2 * block_size values. An insert binary-searches
+    # the block, then the position inside it, so it costs O(log n) comparisons
+    # and only shifts the elements of a single block.
+
+    def __init__(self, iterable=(), block_size=DEFAULT_BLOCK_SIZE):
+        if block_size < 1:
+            raise ValueError(f"block_size must be at least 1, got {block_size}")
+        self._block_size = block_size
+        self._blocks = []
+        self._len = 0
+        self._offsets = None
+        self.extend(iterable)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return chain.from_iterable(self._blocks)
+
+    def __reversed__(self):
+        for block in reversed(self._blocks):
+            yield from reversed(block)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        if self._offsets is None:
+            offsets = []
+            start = 0
+            for block in self._blocks:
+                offsets.append(start)
+                start += len(block)
+            self._offsets = offsets
+        b = bisect_right(self._offsets, index) - 1
+        return self._blocks[b][index - self._offsets[b]]
+
+    def _find_block(self, value):
+        # First block whose smallest value is below value; equal values
+        # already stored stay in front of the new one.
+        blocks = self._blocks
+        lo = 0
+        hi = len(blocks)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if blocks[mid][-1] < value:
+                hi = mid
+            else:
+                lo = mid + 1
+        return min(lo, len(blocks) - 1)
+
+    def add(self, value):
+        blocks = self._blocks
+        if not blocks:
+            blocks.append([value])
+        else:
+            b = self._find_block(value)
+            block = blocks[b]
+            block.insert(_bisect_decreasing(block, value, 0, len(block)), value)
+            if len(block) > 2 * self._block_size:
+                half = len(block) // 2
+                blocks[b:b + 1] = [block[:half], block[half:]]
+        self._len += 1
+        self._offsets = None
+
+    def extend(self, values):
+        values = list(values)
+        if not values:
+            return
+        if len(values) * 8 < self._len:
+            for value in values:
+                self.add(value)
+            return
+        # Bulk load: sort the new values, merge them behind the stored ones
+        # and re-block the result.
+        merged = list(self)
+        n = len(merged)
+        merged.extend(values)
+        _hybrid_sort(merged, n, len(merged))
+        _merge_decreasing(merged, 0, n, len(merged), len(merged))
+        size = self._block_size
+        self._blocks = [merged[i:i + size] for i in range(0, len(merged), size)]
+        self._len = len(merged)
+        self._offsets = None
+
+    def pop_max(self):
+        if not self._blocks:
+            raise IndexError(f"pop from empty {type(self).__name__}")
+        block = self._blocks[0]
+        value = block.pop(0)
+        if not block:
+            del self._blocks[0]
+        self._len -= 1
+        self._offsets = None
+        return value
+
+
 def print_array(arr, label="Array"):
     print(f"{label}: {arr}")
 
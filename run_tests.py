@@ -7,40 +7,229 @@ for the insertion sort implementation.
 """
 
 import sys
+import io
+import os
+import json
+import time
+import signal
 import argparse
+import itertools
+from contextlib import redirect_stdout, redirect_stderr
+from concurrent.futures import ProcessPoolExecutor
 from test_insertion_sort import (
     TestInsertionSortDecreasing,
     TestInsertionSortDecreasingInplace,
+    TestBinaryInsertionStrategy,
+    TestHybridSort,
+    TestNumpyBackend,
+    TestNumpyMissing,
+    TestIntegerBackend,
+    TestFloatTotalOrder,
+    TestSortedDescending,
+    TestTopK,
+    TestIterDecreasing,
+    TestKeyFunction,
+    TestParallelSort,
+    TestAsyncSort,
+    TestExternalSort,
+    TestBufferProtocolInplace,
+    TestSortStats,
+    TestPresortedInput,
+    TestShellSort,
+    TestLibrarySort,
+    TestSortMany,
+    TestIncrementalResort,
+    TestArgsort,
+    TestRecordSort,
     TestPerformance,
+    TestBenchmarkSuite,
+    TestBenchmarkComparison,
+    TestComplexityProfile,
     TestEdgeCases,
     TestNegativeCases,
     TestHelperFunctions,
     run_performance_benchmark,
-    run_stress_test
+    run_stress_test,
+    compare_benchmark_results,
+    run_complexity_profile,
+    BENCHMARK_JSON,
+    PROFILE_TOLERANCE,
 )
 import unittest
 
 
-def run_unit_tests(verbose=False):
-    """Run all unit tests."""
+UNIT_TEST_CLASSES = [
+    TestInsertionSortDecreasing,
+    TestInsertionSortDecreasingInplace,
+    TestBinaryInsertionStrategy,
+    TestHybridSort,
+    TestNumpyBackend,
+    TestNumpyMissing,
+    TestIntegerBackend,
+    TestFloatTotalOrder,
+    TestSortedDescending,
+    TestTopK,
+    TestIterDecreasing,
+    TestKeyFunction,
+    TestParallelSort,
+    TestAsyncSort,
+    TestExternalSort,
+    TestBufferProtocolInplace,
+    TestSortStats,
+    TestPresortedInput,
+    TestShellSort,
+    TestLibrarySort,
+    TestSortMany,
+    TestIncrementalResort,
+    TestArgsort,
+    TestRecordSort,
+    TestPerformance,
+    TestBenchmarkSuite,
+    TestBenchmarkComparison,
+    TestComplexityProfile,
+    TestEdgeCases,
+    TestNegativeCases,
+    TestHelperFunctions,
+]
+SLOWEST_TESTS = 10
+
+
+class TestTimeoutError(Exception):
+    """Raised inside a test that ran longer than its --timeout."""
+
+
+def run_single_test(test_id, timeout=None):
+    """Run one test by id and return a picklable summary of its outcome.
+    
+    Anything the test prints is captured instead of interleaving with other
+    workers. With a timeout, SIGALRM interrupts the test after that many
+    seconds. The alarm is handled between Python bytecodes, so a single
+    long-running C call finishes first.
+    """
+    suite = unittest.TestLoader().loadTestsFromName(test_id)
+    result = unittest.TestResult()
+    output = io.StringIO()
+    timed_out = []
+    
+    def on_alarm(signum, frame):
+        timed_out.append(True)
+        raise TestTimeoutError(f"exceeded the {timeout}s timeout")
+    
+    if timeout:
+        previous = signal.signal(signal.SIGALRM, on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    start = time.perf_counter()
+    try:
+        with redirect_stdout(output), redirect_stderr(output):
+            suite.run(result)
+    finally:
+        duration = time.perf_counter() - start
+        if timeout:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+    
+    error_kind = "TIMEOUT" if timed_out else "ERROR"
+    problems = [(error_kind, str(test), trace) for test, trace in result.errors]
+    problems += [("FAIL", str(test), trace) for test, trace in result.failures]
+    problems += [("FAIL", str(test), "Unexpected success\n") for test in result.unexpectedSuccesses]
+    if timed_out:
+        status = "TIMEOUT"
+    elif result.errors:
+        status = "ERROR"
+    elif result.failures or result.unexpectedSuccesses:
+        status = "FAIL"
+    elif result.skipped:
+        status = "skipped"
+    else:
+        status = "ok"
+    return {"id": test_id, "status": status, "duration": duration,
+            "problems": problems, "output": output.getvalue()}
+
+
+class _InProcess:
+    """Executor stand-in that runs map() serially in this process."""
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+    
+    def map(self, function, *iterables):
+        return map(function, *iterables)
+
+
+def run_sharded_tests(test_classes, jobs=1, timeout=None, verbose=False, slowest=SLOWEST_TESTS):
+    """Run test methods across worker processes and report them in a fixed order.
+    
+    Every test method is a separate task. Results are printed in collection
+    order, whatever order the workers finish in. Then come the failure
+    details with any captured output, a summary, and the slowest tests.
+    With jobs=1 the tests run in this process.
+    """
+    loader = unittest.TestLoader()
+    test_ids = [test.id() for test_class in test_classes
+                for test in loader.loadTestsFromTestCase(test_class)]
+    symbols = {"ok": ".", "FAIL": "F", "ERROR": "E", "TIMEOUT": "T", "skipped": "s"}
+    
+    start = time.perf_counter()
+    outcomes = []
+    with ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else _InProcess() as executor:
+        for outcome in executor.map(run_single_test, test_ids, itertools.repeat(timeout)):
+            outcomes.append(outcome)
+            if verbose:
+                print(f"{outcome['id']} ... {outcome['status']} ({outcome['duration']:.3f}s)")
+            else:
+                sys.stdout.write(symbols[outcome["status"]])
+                sys.stdout.flush()
+    elapsed = time.perf_counter() - start
+    if not verbose:
+        print()
+    
+    for outcome in outcomes:
+        for kind, description, trace in outcome["problems"]:
+            print("=" * 70)
+            print(f"{kind}: {description}")
+            print("-" * 70)
+            print(trace.rstrip())
+        if outcome["problems"] and outcome["output"]:
+            print("-" * 70)
+            print("Captured output:")
+            print(outcome["output"].rstrip())
+    
+    counts = {status: sum(1 for o in outcomes if o["status"] == status) for status in symbols}
+    print("-" * 70)
+    print(f"Ran {len(outcomes)} tests in {elapsed:.3f}s using {jobs} job(s)")
+    success = counts["FAIL"] == counts["ERROR"] == counts["TIMEOUT"] == 0
+    details = ", ".join(f"{label}={counts[status]}" for status, label in
+                        [("FAIL", "failures"), ("ERROR", "errors"),
+                         ("TIMEOUT", "timeouts"), ("skipped", "skipped")] if counts[status])
+    print(("OK" if success else "FAILED") + (f" ({details})" if details else ""))
+    
+    if slowest:
+        print(f"\nSlowest {min(slowest, len(outcomes))} tests:")
+        for outcome in sorted(outcomes, key=lambda o: o["duration"], reverse=True)[:slowest]:
+            print(f"  {outcome['duration']:8.3f}s  {outcome['id']}")
+    return success
+
+
+def run_unit_tests(verbose=False, jobs=None, timeout=None):
+    """Run all unit tests.
+    
+    With jobs or timeout set, the tests are sharded by method through
+    run_sharded_tests instead of one TextTestRunner.
+    """
     print("Running Unit Tests...")
     print("=" * 50)
     
+    if jobs is not None or timeout is not None:
+        return run_sharded_tests(UNIT_TEST_CLASSES, jobs or 1, timeout, verbose)
+    
     # Create test suite
     loader = unittest.TestLoader()
     suite = unittest.TestSuite()
     
-    # Add test classes
-    test_classes = [
-        TestInsertionSortDecreasing,
-        TestInsertionSortDecreasingInplace,
-        TestPerformance,
-        TestEdgeCases,
-        TestNegativeCases,
-        TestHelperFunctions
-    ]
-    
-    for test_class in test_classes:
+    for test_class in UNIT_TEST_CLASSES:
         tests = loader.loadTestsFromTestCase(test_class)
         suite.addTests(tests)
     
@@ -108,6 +297,70 @@ def run_negative_tests(verbose=False):
     return result.wasSuccessful()
 
 
+def save_benchmark_baseline(baseline_path):
+    """Run the benchmark suite and store its results as the baseline."""
+    print("Saving Benchmark Baseline...")
+    run_performance_benchmark(json_path=baseline_path)
+    print(f"Baseline saved to {baseline_path}")
+
+
+def format_factor(factor):
+    """Describe a current/baseline median ratio as a speedup or slowdown."""
+    if factor is None:
+        return "-"
+    if factor >= 1:
+        return f"{factor:.2f}x slower"
+    return f"{1 / factor:.2f}x faster"
+
+
+def compare_benchmark_baseline(baseline_path, json_path, threshold, alpha):
+    """Run the benchmark suite and compare it against a stored baseline.
+    
+    Prints a per-scenario diff table and returns False if any scenario
+    regressed by more than threshold with significance alpha.
+    """
+    with open(baseline_path) as f:
+        baseline = json.load(f)["results"]
+    
+    current = run_performance_benchmark(json_path=json_path)
+    rows = compare_benchmark_results(baseline, current, threshold, alpha)
+    
+    print("\n" + "=" * 90)
+    print(f"BASELINE COMPARISON (threshold {threshold:.0%}, alpha {alpha})")
+    print("=" * 90)
+    print(f"{'distribution':<15}{'engine':<16}{'size':>8}{'baseline':>13}{'current':>13}"
+          f"{'change':>15}{'p':>8}  status")
+    print("-" * 90)
+    for row in rows:
+        baseline_ns = "-" if row["baseline_ns"] is None else f"{row['baseline_ns'] / 1e6:.3f}ms"
+        current_ns = "-" if row["current_ns"] is None else f"{row['current_ns'] / 1e6:.3f}ms"
+        p_value = "-" if row["p_value"] is None else f"{row['p_value']:.3f}"
+        print(f"{row['distribution']:<15}{row['engine']:<16}{row['size']:>8}{baseline_ns:>13}"
+              f"{current_ns:>13}{format_factor(row['factor']):>15}{p_value:>8}  {row['status']}")
+    
+    regressions = [row for row in rows if row["status"] == "regression"]
+    print(f"\n{len(regressions)} regression(s) in {len(rows)} scenario(s)")
+    return not regressions
+
+
+def run_complexity_profiler(tolerance):
+    """Profile every engine's growth rate and report engines that exceed their class.
+    
+    Returns False if any engine grew faster than its expected model on any
+    distribution.
+    """
+    rows = run_complexity_profile(tolerance=tolerance)
+    flagged = [row for row in rows if row["flagged"]]
+    
+    print("\n" + "=" * 60)
+    print(f"{len(flagged)} of {len(rows)} profile(s) exceed their expected class")
+    for row in flagged:
+        print(f"  {row['engine']} on {row['distribution']}: exponent "
+              f"{row['exponent']:.2f} ± {row['ci']:.2f}, best fit {row['best_model']}, "
+              f"expected {row['expected']} (limit {row['limit']:.2f})")
+    return not flagged
+
+
 def main():
     """Main function to handle command line arguments."""
     parser = argparse.ArgumentParser(description='Test runner for insertion sort implementation')
@@ -117,14 +370,38 @@ def main():
                        help='Run only unit tests (no benchmarks)')
     parser.add_argument('--benchmark', action='store_true',
                        help='Run only performance benchmarks')
+    parser.add_argument('--benchmark-json', default=BENCHMARK_JSON, metavar='PATH',
+                       help=f'Where to write benchmark results as JSON (default: {BENCHMARK_JSON})')
+    parser.add_argument('--save-baseline', metavar='PATH',
+                       help='Run benchmarks and store the results as a baseline')
+    parser.add_argument('--compare-baseline', metavar='PATH',
+                       help='Run benchmarks and fail on regressions against a baseline')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                       help='Relative median slowdown tolerated before failing (default: 0.10)')
+    parser.add_argument('--alpha', type=float, default=0.05,
+                       help='Significance level of the regression test (default: 0.05)')
+    parser.add_argument('--profile', action='store_true',
+                       help='Fit each engine\'s growth rate and flag engines that exceed their class')
+    parser.add_argument('--tolerance', type=float, default=PROFILE_TOLERANCE,
+                       help=f'Exponent headroom over the expected class (default: {PROFILE_TOLERANCE})')
     parser.add_argument('--stress', action='store_true',
                        help='Run only stress tests')
     parser.add_argument('--negative', action='store_true',
                        help='Run only negative test cases')
+    parser.add_argument('--jobs', '-j', type=int, metavar='N',
+                       help='Run unit tests in N worker processes (0 = one per CPU)')
+    parser.add_argument('--timeout', type=float, metavar='SECONDS',
+                       help='Fail any unit test that runs longer than this')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Verbose output')
     
     args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 0:
+        parser.error('--jobs must be non-negative')
+    if args.jobs == 0:
+        args.jobs = os.cpu_count() or 1
+    if args.timeout is not None and args.timeout <= 0:
+        parser.error('--timeout must be positive')
     
     print("Insertion Sort Test Runner")
     print("=" * 50)
@@ -133,9 +410,16 @@ def main():
     
     if args.quick:
         success = run_quick_tests()
+    elif args.save_baseline:
+        save_benchmark_baseline(args.save_baseline)
+    elif args.compare_baseline:
+        success = compare_benchmark_baseline(args.compare_baseline, args.benchmark_json,
+                                             args.threshold, args.alpha)
     elif args.benchmark:
         print("Running Performance Benchmarks...")
-        run_performance_benchmark()
+        run_performance_benchmark(json_path=args.benchmark_json)
+    elif args.profile:
+        success = run_complexity_profiler(args.tolerance)
     elif args.stress:
         print("Running Stress Tests...")
         run_stress_test()
@@ -143,14 +427,14 @@ def main():
         print("Running Negative Test Cases...")
         success = run_negative_tests(args.verbose)
     elif args.unit_only:
-        success = run_unit_tests(args.verbose)
+        success = run_unit_tests(args.verbose, args.jobs, args.timeout)
     else:
         # Run everything
-        success = run_unit_tests(args.verbose)
+        success = run_unit_tests(args.verbose, args.jobs, args.timeout)
         
         if success:
             print("\n" + "=" * 50)
-            run_performance_benchmark()
+            run_performance_benchmark(json_path=args.benchmark_json)
             
             print("\n" + "=" * 50)
             run_stress_test()
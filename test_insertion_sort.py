@@ -10,10 +10,67 @@ import unittest
 import random
 import time
 import sys
+import os
+import math
+import tempfile
+import json
+import platform
+import collections
+import itertools
+import statistics
+import asyncio
+import io
+from array import array
+from contextlib import redirect_stdout
+from dataclasses import dataclass
 from typing import List, Tuple
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import insertion_sort_decreasing as sort_module
 
 # Import the functions to test
-from insertion_sort_decreasing import insertion_sort_decreasing, insertion_sort_decreasing_inplace
+from insertion_sort_decreasing import (
+    insertion_sort_decreasing,
+    insertion_sort_decreasing_inplace,
+    hybrid_sort_decreasing,
+    hybrid_sort_decreasing_inplace,
+    numpy_sort_decreasing,
+    SortedDescending,
+    top_k_decreasing,
+    parallel_sort_decreasing,
+    external_sort_decreasing,
+    sort_with_stats,
+    SortStats,
+    shell_sort_decreasing_inplace,
+    library_sort_decreasing_inplace,
+    GAP_SEQUENCES,
+    DEFAULT_LIBRARY_EPSILON,
+    sort_many_decreasing,
+    insertion_sort_decreasing_async,
+    resort_decreasing_inplace,
+    argsort_decreasing,
+    apply_permutation,
+    iter_decreasing,
+    sort_records_decreasing,
+)
+
+
+class Keyed:
+    """Element ordered by key alone, with a tag to check tie order; defines only <."""
+    
+    def __init__(self, key, tag):
+        self.key = key
+        self.tag = tag
+    
+    def __lt__(self, other):
+        return self.key < other.key
 
 
 class TestInsertionSortDecreasing(unittest.TestCase):
@@ -193,6 +250,1827 @@ class TestInsertionSortDecreasingInplace(unittest.TestCase):
         self.assertEqual(original, [9, 8, 5, 3, 2, 1])
 
 
+class TestBinaryInsertionStrategy(unittest.TestCase):
+    """Test cases for the binary-insertion strategy of both sort functions."""
+    
+    def test_basic_sorting(self):
+        """Test basic sorting functionality with binary insertion."""
+        test_cases = [
+            ([5, 2, 8, 1, 9, 3], [9, 8, 5, 3, 2, 1]),
+            ([64, 34, 25, 12, 22, 11, 90], [90, 64, 34, 25, 22, 12, 11]),
+            ([3, 1, 4, 1, 5, 9, 2, 6], [9, 6, 5, 4, 3, 2, 1, 1]),
+            ([], []),
+            ([1], [1]),
+        ]
+        
+        for input_arr, expected in test_cases:
+            with self.subTest(input_arr=input_arr):
+                self.assertEqual(insertion_sort_decreasing(input_arr, strategy="binary"), expected)
+                arr_copy = input_arr.copy()
+                result = insertion_sort_decreasing_inplace(arr_copy, strategy="binary")
+                self.assertIs(result, arr_copy)
+                self.assertEqual(arr_copy, expected)
+    
+    def test_matches_linear_strategy(self):
+        """Test that binary insertion matches linear insertion on random input."""
+        rng = random.Random(7)
+        for size in [2, 10, 57, 200]:
+            with self.subTest(size=size):
+                arr = [rng.randint(-50, 50) for _ in range(size)]
+                self.assertEqual(
+                    insertion_sort_decreasing(arr, strategy="binary"),
+                    insertion_sort_decreasing(arr, strategy="linear"),
+                )
+    
+    def test_sorting_stability(self):
+        """Test that binary insertion keeps equal elements in their original order."""
+        items = [Keyed(k, t) for k, t in [(5, 'a'), (3, 'b'), (5, 'c'), (3, 'd'), (5, 'e')]]
+        result = insertion_sort_decreasing(items, strategy="binary")
+        self.assertEqual([item.tag for item in result], ['a', 'c', 'e', 'b', 'd'])
+        
+        input_arr = [(5, 'a'), (3, 'b'), (5, 'c'), (3, 'd')]
+        result = insertion_sort_decreasing(input_arr, strategy="binary")
+        self.assertEqual(result, [(5, 'c'), (5, 'a'), (3, 'd'), (3, 'b')])
+    
+    def test_fewer_comparisons_than_linear(self):
+        """Test that binary insertion needs O(n log n) comparisons on near-worst-case input."""
+        class Counted:
+            comparisons = 0
+            
+            def __init__(self, value):
+                self.value = value
+            
+            def __lt__(self, other):
+                Counted.comparisons += 1
+                return self.value < other.value
+        
+        # Ascending apart from the first pair, so no presorted fast path applies
+        arr = [Counted(v) for v in [1, 0] + list(range(2, 256))]
+        insertion_sort_decreasing(arr, strategy="binary")
+        binary_comparisons = Counted.comparisons
+        
+        Counted.comparisons = 0
+        insertion_sort_decreasing(arr, strategy="linear")
+        linear_comparisons = Counted.comparisons
+        
+        self.assertLess(binary_comparisons, 256 * 9)
+        self.assertLess(binary_comparisons * 10, linear_comparisons)
+    
+    def test_unknown_strategy(self):
+        """Test that an unknown strategy raises ValueError."""
+        with self.assertRaises(ValueError):
+            insertion_sort_decreasing([3, 1, 2], strategy="bogus")
+        
+        with self.assertRaises(ValueError):
+            insertion_sort_decreasing_inplace([3, 1, 2], strategy="bogus")
+
+
+class TestHybridSort(unittest.TestCase):
+    """Test cases for the hybrid insertion/merge sort engine."""
+    
+    # Inputs exercised elsewhere in this module
+    SUITE_INPUTS = [
+        [5, 2, 8, 1, 9, 3],
+        [64, 34, 25, 12, 22, 11, 90],
+        [3, 1, 4, 1, 5, 9, 2, 6],
+        [1, 2, 3, 4, 5],
+        [5, 4, 3, 2, 1],
+        [],
+        [42],
+        [3, 3, 3, 3],
+        [5, 2, 5, 2, 5],
+        [-10, 5, -3, 0, 2],
+        [5, 0, -2, 0, 3],
+        [2**31 - 1, 2**31 - 2, 2**31 - 3],
+        [sys.maxsize, sys.maxsize - 1, sys.maxsize - 2],
+        [1, 1.5, 2, 2.5],
+        [(5, 'a'), (3, 'b'), (5, 'c'), (3, 'd')],
+        [[1, 2], [3, 4]],
+        [True, False, True],
+        [1, float('inf'), 3],
+        ["hello", "world", "test"],
+        ["🚀", "🌟", "⭐"],
+    ]
+    
+    def test_matches_insertion_sort_on_suite_inputs(self):
+        """Test that every engine variant matches insertion_sort_decreasing exactly."""
+        for arr in self.SUITE_INPUTS:
+            expected = insertion_sort_decreasing(arr)
+            for cutoff in [1, 2, 32]:
+                with self.subTest(array=arr, cutoff=cutoff):
+                    self.assertEqual(hybrid_sort_decreasing(arr, cutoff=cutoff), expected)
+                    arr_copy = arr.copy()
+                    hybrid_sort_decreasing_inplace(arr_copy, cutoff=cutoff, buffer_size=1)
+                    self.assertEqual(arr_copy, expected)
+                    self.assertEqual(insertion_sort_decreasing(arr, strategy="hybrid"), expected)
+    
+    def test_random_arrays_against_insertion_sort(self):
+        """Test random arrays with many duplicates across cutoffs and buffer sizes."""
+        rng = random.Random(11)
+        for size in [0, 1, 7, 33, 100, 513]:
+            for buffer_size in [1, 4, 1024]:
+                with self.subTest(size=size, buffer_size=buffer_size):
+                    arr = [rng.randint(0, 20) for _ in range(size)]
+                    expected = insertion_sort_decreasing(arr)
+                    self.assertEqual(hybrid_sort_decreasing(arr, cutoff=8), expected)
+                    arr_copy = arr.copy()
+                    hybrid_sort_decreasing_inplace(arr_copy, cutoff=8, buffer_size=buffer_size)
+                    self.assertEqual(arr_copy, expected)
+    
+    def test_stability(self):
+        """Test that the merge keeps equal elements in their original order."""
+        rng = random.Random(3)
+        items = [Keyed(rng.randint(0, 5), i) for i in range(300)]
+        expected = [(item.key, item.tag) for item in sorted(items, key=lambda item: -item.key)]
+        
+        result = hybrid_sort_decreasing(items, cutoff=4)
+        self.assertEqual([(item.key, item.tag) for item in result], expected)
+        
+        items_copy = items.copy()
+        hybrid_sort_decreasing_inplace(items_copy, cutoff=4, buffer_size=2)
+        self.assertEqual([(item.key, item.tag) for item in items_copy], expected)
+    
+    def test_original_array_unchanged(self):
+        """Test that the non-destructive variant leaves its input alone."""
+        original = [5, 2, 8, 1, 9, 3]
+        hybrid_sort_decreasing(original)
+        self.assertEqual(original, [5, 2, 8, 1, 9, 3])
+    
+    def test_large_array(self):
+        """Test that large inputs sort in O(n log n) time."""
+        rng = random.Random(5)
+        arr = list(range(100000))
+        rng.shuffle(arr)
+        
+        start_time = time.time()
+        result = hybrid_sort_decreasing(arr)
+        execution_time = time.time() - start_time
+        
+        self.assertEqual(result, list(range(99999, -1, -1)))
+        self.assertLess(execution_time, 10.0)
+    
+    def test_invalid_parameters(self):
+        """Test that non-positive cutoff or buffer sizes raise ValueError."""
+        with self.assertRaises(ValueError):
+            hybrid_sort_decreasing([3, 1, 2], cutoff=0)
+        
+        with self.assertRaises(ValueError):
+            hybrid_sort_decreasing_inplace([3, 1, 2], buffer_size=0)
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestNumpyBackend(unittest.TestCase):
+    """Test cases for the vectorized NumPy backend."""
+    
+    def test_integer_list(self):
+        """Test that integer lists sort correctly and come back as lists of ints."""
+        arr = [5, 2, 8, 1, 9, 3, -4, 2]
+        result = insertion_sort_decreasing(arr, backend="numpy")
+        self.assertEqual(result, [9, 8, 5, 3, 2, 2, 1, -4])
+        self.assertIs(type(result), list)
+        self.assertTrue(all(type(x) is int for x in result))
+        self.assertEqual(arr, [5, 2, 8, 1, 9, 3, -4, 2])
+    
+    def test_float_list(self):
+        """Test that float lists sort correctly and come back as lists of floats."""
+        arr = [1.5, -2.25, float('inf'), 0.0, float('-inf')]
+        result = numpy_sort_decreasing(arr)
+        self.assertEqual(result, [float('inf'), 1.5, 0.0, -2.25, float('-inf')])
+        self.assertTrue(all(type(x) is float for x in result))
+    
+    def test_ndarray_returns_ndarray(self):
+        """Test that ndarray input returns an ndarray with the same dtype."""
+        for dtype in [np.int32, np.int64, np.uint8, np.float32, np.float64]:
+            with self.subTest(dtype=dtype):
+                arr = np.array([3, 1, 4, 1, 5, 9, 2, 6], dtype=dtype)
+                result = insertion_sort_decreasing(arr, backend="auto")
+                self.assertIsInstance(result, np.ndarray)
+                self.assertEqual(result.dtype, arr.dtype)
+                self.assertEqual(result.tolist(), [9, 6, 5, 4, 3, 2, 1, 1])
+                self.assertEqual(arr.tolist(), [3, 1, 4, 1, 5, 9, 2, 6])
+    
+    def test_inplace(self):
+        """Test in-place sorting of lists and ndarrays."""
+        arr = [3, 1, 2]
+        self.assertIs(insertion_sort_decreasing_inplace(arr, backend="numpy"), arr)
+        self.assertEqual(arr, [3, 2, 1])
+        
+        array = np.array([0.5, 2.5, 1.5])
+        self.assertIs(insertion_sort_decreasing_inplace(array, backend="numpy"), array)
+        self.assertEqual(array.tolist(), [2.5, 1.5, 0.5])
+    
+    def test_empty_input(self):
+        """Test that an empty list is valid numeric input for every entry point."""
+        for backend in ["numpy", "auto"]:
+            with self.subTest(backend=backend):
+                self.assertEqual(insertion_sort_decreasing([], backend=backend), [])
+                self.assertEqual(insertion_sort_decreasing_inplace([], backend=backend), [])
+                self.assertEqual(list(argsort_decreasing([], backend=backend)), [])
+                self.assertEqual(insertion_sort_decreasing([], backend=backend, key=abs), [])
+                self.assertEqual(insertion_sort_decreasing_inplace([], backend=backend, key=abs), [])
+                self.assertEqual(sort_records_decreasing([], ["a"], backend=backend), [])
+                self.assertEqual(sort_records_decreasing({"a": []}, ["a"], backend=backend),
+                                 {"a": []})
+                self.assertEqual(sort_many_decreasing([[], [2, 1]], backend=backend), [[], [2, 1]])
+        self.assertEqual(numpy_sort_decreasing([]), [])
+        self.assertEqual(insertion_sort_decreasing(np.array([]), backend="numpy").tolist(), [])
+    
+    def test_matches_python_engine(self):
+        """Test that the NumPy backend matches the pure-Python result."""
+        rng = random.Random(13)
+        for size in [1, 10, 1000]:
+            with self.subTest(size=size):
+                ints = [rng.randint(-1000, 1000) for _ in range(size)]
+                floats = [rng.uniform(-1, 1) for _ in range(size)]
+                self.assertEqual(insertion_sort_decreasing(ints, backend="numpy"),
+                                 hybrid_sort_decreasing(ints))
+                self.assertEqual(insertion_sort_decreasing(floats, backend="numpy"),
+                                 hybrid_sort_decreasing(floats))
+    
+    def test_nan_placement_policy(self):
+        """Test that NaNs are placed last by default, or first on request."""
+        nan_arrays = [
+            [1.0, float('nan'), 3.0],
+            [float('nan'), 1.0, 3.0],
+            [1.0, 3.0, float('nan')],
+            [float('nan'), float('inf'), float('nan'), float('-inf')],
+            # Ints mixed with floats are promoted to float64
+            [1, float('nan'), 3],
+            [float('nan'), 1, 3],
+            [1, 3, float('nan')],
+        ]
+        
+        for arr in nan_arrays:
+            with self.subTest(array=arr):
+                nan_count = sum(math.isnan(x) for x in arr)
+                numbers = sorted((x for x in arr if not math.isnan(x)), reverse=True)
+                
+                for backend in ["numpy", "auto"]:
+                    result = insertion_sort_decreasing(arr, backend=backend)
+                    self.assertEqual(result[:len(numbers)], numbers)
+                    self.assertEqual(list(map(type, result[:len(numbers)])),
+                                     list(map(type, numbers)))
+                    self.assertTrue(all(math.isnan(x) for x in result[len(numbers):]))
+                
+                result = numpy_sort_decreasing(arr, nan_position="first")
+                self.assertTrue(all(math.isnan(x) for x in result[:nan_count]))
+                self.assertEqual(result[nan_count:], numbers)
+    
+    def test_non_numeric_input_falls_back(self):
+        """Test that backend='auto' uses the Python engine for non-numeric input."""
+        fallback_inputs = [
+            [2**53 + 1, 2.5, 3],         # An int float64 cannot hold exactly
+            [True, False, True],         # Booleans
+            [2**70, 1, 2**64],           # Beyond int64
+            ["b", "a", "c"],
+            [(5, 'a'), (3, 'b'), (5, 'c')],
+            [],
+        ]
+        
+        for arr in fallback_inputs:
+            with self.subTest(array=arr):
+                self.assertEqual(insertion_sort_decreasing(arr, backend="auto"),
+                                 insertion_sort_decreasing(arr))
+    
+    def test_invalid_backend_arguments(self):
+        """Test errors for non-numeric input, unknown backends and NaN positions."""
+        with self.assertRaises(TypeError):
+            insertion_sort_decreasing(["a", "b"], backend="numpy")
+        
+        with self.assertRaises(TypeError):
+            numpy_sort_decreasing(np.array([[1, 2], [3, 4]]))
+        
+        with self.assertRaises(ValueError):
+            insertion_sort_decreasing([1, 2], backend="fortran")
+        
+        with self.assertRaises(ValueError):
+            numpy_sort_decreasing([1.0, 2.0], nan_position="middle")
+
+
+class TestNumpyMissing(unittest.TestCase):
+    """Test behavior of the NumPy backend when NumPy is not installed."""
+    
+    def test_auto_backend_without_numpy(self):
+        """Test that backend='auto' falls back to the Python engine."""
+        with mock.patch.object(sort_module, "np", None):
+            self.assertEqual(insertion_sort_decreasing([3, 1, 2], backend="auto"), [3, 2, 1])
+            arr = [1.5, 0.5, 2.5]
+            insertion_sort_decreasing_inplace(arr, backend="auto")
+            self.assertEqual(arr, [2.5, 1.5, 0.5])
+    
+    def test_numpy_backend_without_numpy(self):
+        """Test that explicitly requesting NumPy raises ImportError."""
+        with mock.patch.object(sort_module, "np", None):
+            with self.assertRaises(ImportError):
+                insertion_sort_decreasing([3, 1, 2], backend="numpy")
+            
+            with self.assertRaises(ImportError):
+                numpy_sort_decreasing([3, 1, 2])
+
+
+class TestIntegerBackend(unittest.TestCase):
+    """Test the counting/radix backend for lists of integers."""
+    
+    def test_matches_sorted(self):
+        """Test small, medium and full 64-bit value ranges."""
+        rng = random.Random(157)
+        for value_range in [0, 1, 4, 1000, 10**6, 2**40]:
+            for size in [1, 2, 10, 300, 5000]:
+                arr = [rng.randint(-value_range, value_range) for _ in range(size)]
+                with self.subTest(range=value_range, size=size):
+                    self.assertEqual(insertion_sort_decreasing(arr, backend="radix"),
+                                     sorted(arr, reverse=True))
+                    data = arr.copy()
+                    self.assertIs(insertion_sort_decreasing_inplace(data, backend="radix"), data)
+                    self.assertEqual(data, sorted(arr, reverse=True))
+        extremes = [2**63 - 1, -2**63, 0, -1, 2**63 - 1, -2**63]
+        self.assertEqual(insertion_sort_decreasing(extremes, backend="radix"),
+                         sorted(extremes, reverse=True))
+    
+    def test_int64_arrays(self):
+        """Test that array('q') takes the integer path and keeps its typecode."""
+        arr = array("q", [3, -2**63, 7, 2**63 - 1, 7, 0])
+        expected = array("q", sorted(arr, reverse=True))
+        kernel = mock.Mock()
+        with mock.patch.dict(sort_module._STRATEGIES, {"linear": kernel}):
+            self.assertEqual(insertion_sort_decreasing(arr, backend="radix"), expected)
+            data = array("q", arr)
+            self.assertIs(insertion_sort_decreasing_inplace(data, backend="radix"), data)
+        kernel.assert_not_called()
+        self.assertEqual(data, expected)
+        self.assertEqual(list(argsort_decreasing(arr, backend="radix")), [3, 2, 4, 0, 5, 1])
+    
+    def test_no_comparisons(self):
+        """Test that counting and radix paths never call the comparison engine."""
+        rng = random.Random(163)
+        small_range = [rng.randint(1, 1000) for _ in range(2000)]
+        wide_range = [rng.randint(-10**15, 10**15) for _ in range(2000)]
+        for arr in [small_range, wide_range]:
+            kernel = mock.Mock()
+            with mock.patch.dict(sort_module._STRATEGIES, {"linear": kernel}):
+                result = insertion_sort_decreasing(arr, backend="radix")
+            kernel.assert_not_called()
+            self.assertEqual(result, sorted(arr, reverse=True))
+    
+    def test_radix_digits(self):
+        """Test the switch from one counting pass to balanced radix passes."""
+        self.assertEqual(sort_module._radix_digits(999, 1000), (10, 1))
+        self.assertEqual(sort_module._radix_digits(2**30 - 1, 1000), (10, 3))
+        self.assertEqual(sort_module._radix_digits(2**64 - 1, 1000), (10, 7))
+        self.assertEqual(sort_module._radix_digits(2**64 - 1, 10**6), (11, 6))
+    
+    def test_fallback_to_comparison_engine(self):
+        """Test that bools, inexact int/float mixes and huge ints use the selected strategy."""
+        for arr in [[True, False, True], [2**53 + 1, 1.5, 2], [10**20, 5, -10**20], ["b", "a"]]:
+            with self.subTest(arr=arr):
+                kernel = mock.Mock(wraps=sort_module._binary_insertion)
+                with mock.patch.dict(sort_module._STRATEGIES, {"binary": kernel}):
+                    result = insertion_sort_decreasing(arr, strategy="binary", backend="radix")
+                kernel.assert_called_once()
+                self.assertEqual(result, sorted(arr, reverse=True))
+        self.assertEqual(insertion_sort_decreasing([], backend="radix"), [])
+    
+    def test_integer_keys_are_stable(self):
+        """Test key= with integer keys: ties keep their original order."""
+        rng = random.Random(167)
+        for value_range in [3, 10**9]:
+            records = [(rng.randint(0, value_range), tag) for tag in range(1000)]
+            expected = sorted(records, key=lambda r: r[0], reverse=True)
+            with self.subTest(range=value_range):
+                self.assertEqual(
+                    insertion_sort_decreasing(records, backend="radix", key=lambda r: r[0]),
+                    expected)
+                data = records.copy()
+                insertion_sort_decreasing_inplace(data, backend="radix", key=lambda r: r[0])
+                self.assertEqual(data, expected)
+    
+    def test_auto_prefers_counting(self):
+        """Test that backend='auto' uses counting sort for small ranges."""
+        arr = [random.Random(173).randint(1, 50) for _ in range(1000)]
+        with mock.patch.object(sort_module, "_integer_sort", wraps=sort_module._integer_sort) as path:
+            result = insertion_sort_decreasing(arr, backend="auto")
+        path.assert_called_once()
+        self.assertEqual(result, sorted(arr, reverse=True))
+    
+    def test_auto_without_numpy_uses_radix(self):
+        """Test that backend='auto' takes the radix path for wide ranges without NumPy."""
+        rng = random.Random(179)
+        arr = [rng.randint(-2**62, 2**62) for _ in range(1000)]
+        with mock.patch.object(sort_module, "np", None), \
+                mock.patch.object(sort_module, "_integer_sort", wraps=sort_module._integer_sort) as path:
+            result = insertion_sort_decreasing(arr, backend="auto")
+        path.assert_called_once()
+        self.assertEqual(result, sorted(arr, reverse=True))
+    
+    def test_integer_is_an_alias_of_radix(self):
+        """Test that the original backend name 'integer' behaves exactly like 'radix'."""
+        rng = random.Random(181)
+        inputs = [[rng.randint(-10**12, 10**12) for _ in range(300)],
+                  [rng.uniform(-1, 1) for _ in range(300)] + [-0.0, 0.0],
+                  array("d", [2.5, -1.0, 7.0])]
+        for arr in inputs:
+            with self.subTest(arr=type(arr).__name__):
+                kernel = mock.Mock()
+                with mock.patch.dict(sort_module._STRATEGIES, {"linear": kernel}):
+                    expected = insertion_sort_decreasing(arr, backend="radix")
+                    self.assertEqual([repr(v) for v in insertion_sort_decreasing(arr, backend="integer")],
+                                     [repr(v) for v in expected])
+                kernel.assert_not_called()
+                self.assertEqual(argsort_decreasing(arr, backend="integer"),
+                                 argsort_decreasing(arr, backend="radix"))
+
+
+class TestFloatTotalOrder(unittest.TestCase):
+    """Test the float key path of the radix backend."""
+    
+    SPECIALS = [0.0, -0.0, float("inf"), float("-inf"), float("nan"), -float("nan"),
+                5e-324, -5e-324, sys.float_info.max, -sys.float_info.max]
+    
+    @staticmethod
+    def total_order(value):
+        """Sort key for the documented order: NaN lowest, -0.0 below 0.0."""
+        if math.isnan(value):
+            return (0, 0.0, 0.0)
+        return (1, value, math.copysign(1.0, value))
+    
+    def assertSameFloats(self, actual, expected):
+        self.assertEqual([repr(v) for v in actual], [repr(v) for v in expected])
+    
+    def test_special_values(self):
+        """Test NaN last, +inf first and +0.0 before -0.0."""
+        result = insertion_sort_decreasing([-0.0, float("nan"), 1.0, float("-inf"), 0.0,
+                                            float("inf"), -1.0], backend="radix")
+        self.assertSameFloats(result[:6], [float("inf"), 1.0, 0.0, -0.0, -1.0, float("-inf")])
+        self.assertTrue(math.isnan(result[6]))
+    
+    def test_random_with_specials(self):
+        """Test random floats mixed with special values against the total order."""
+        rng = random.Random(211)
+        for _ in range(200):
+            arr = [rng.choice(self.SPECIALS) if rng.random() < 0.3 else rng.uniform(-1e3, 1e3)
+                   for _ in range(rng.randint(1, 80))]
+            expected = sorted(arr, key=self.total_order, reverse=True)
+            self.assertSameFloats(insertion_sort_decreasing(arr, backend="radix"), expected)
+    
+    def test_nans_keep_their_order(self):
+        """Test that NaN objects come out last, in their original order."""
+        nans = [float("nan") for _ in range(3)]
+        result = insertion_sort_decreasing([nans[0], 2.0, nans[1], 1.0, nans[2]], backend="radix")
+        self.assertEqual(result[:2], [2.0, 1.0])
+        self.assertTrue(all(a is b for a, b in zip(result[2:], nans)))
+    
+    def test_array_and_memoryview(self):
+        """Test array('d') buffers, in place and as a copy."""
+        rng = random.Random(223)
+        values = [rng.choice(self.SPECIALS) if rng.random() < 0.2 else rng.gauss(0, 10)
+                  for _ in range(500)]
+        expected = sorted(values, key=self.total_order, reverse=True)
+        
+        result = insertion_sort_decreasing(array("d", values), backend="radix")
+        self.assertIsInstance(result, array)
+        self.assertSameFloats(result, expected)
+        
+        data = array("d", values)
+        self.assertIs(insertion_sort_decreasing_inplace(data, backend="auto"), data)
+        self.assertSameFloats(data, expected)
+        
+        data = array("d", values)
+        insertion_sort_decreasing_inplace(memoryview(data), backend="radix")
+        self.assertSameFloats(data, expected)
+    
+    def test_float_keys(self):
+        """Test that key= with float keys keeps ties in order."""
+        records = [(0.5, "a"), (-0.0, "b"), (0.5, "c"), (float("nan"), "d"), (0.0, "e")]
+        result = insertion_sort_decreasing(records, backend="radix", key=lambda r: r[0])
+        self.assertEqual([tag for _, tag in result], ["a", "c", "e", "b", "d"])
+    
+    def test_auto_without_numpy(self):
+        """Test that backend='auto' uses the float path when NumPy is missing."""
+        arr = [2.5, float("nan"), -0.0, 0.0]
+        with mock.patch.object(sort_module, "np", None):
+            result = insertion_sort_decreasing(arr, backend="auto")
+        self.assertSameFloats(result[:3], [2.5, 0.0, -0.0])
+        self.assertTrue(math.isnan(result[3]))
+    
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_signed_zeros_agree_across_backends(self):
+        """Test that 0.0 precedes -0.0 whichever path backend='auto' takes."""
+        arr = [-0.0, 1.0, 0.0, -0.0, float("nan"), 0.0, -1.0]
+        expected = sorted(arr, key=self.total_order, reverse=True)
+        with mock.patch.object(sort_module, "np", None):
+            self.assertSameFloats(insertion_sort_decreasing(arr, backend="auto"), expected)
+        self.assertSameFloats(insertion_sort_decreasing(arr, backend="auto"), expected)
+        self.assertSameFloats(insertion_sort_decreasing(arr, backend="numpy"), expected)
+        self.assertSameFloats(insertion_sort_decreasing(array("d", arr), backend="auto"), expected)
+        self.assertSameFloats(insertion_sort_decreasing(np.array(arr), backend="auto").tolist(), expected)
+        self.assertEqual(argsort_decreasing(arr, backend="numpy").tolist(), [1, 2, 5, 0, 3, 6, 4])
+        for row in sort_many_decreasing([arr, arr[::-1]], backend="auto"):
+            self.assertSameFloats(row, expected)
+        
+        # Splitting the zeros must not sort NaNs by sign: inf - inf is -nan.
+        nans = [float("inf") - float("inf"), 1.0, float("nan"), -0.0]
+        signs = [math.copysign(1, v) for v in insertion_sort_decreasing(nans, backend="numpy")]
+        for row in sort_many_decreasing([nans], backend="numpy"):
+            self.assertEqual([math.copysign(1, v) for v in row], signs)
+        self.assertEqual(signs[2:], [-1, 1])
+        
+        result = numpy_sort_decreasing(arr, nan_position="first")
+        self.assertTrue(math.isnan(result[0]))
+        self.assertSameFloats(result[1:], expected[:-1])
+    
+    def test_mixed_int_float_lists(self):
+        """Test that ints mixed with floats take the float path and stay ints."""
+        nan = float("nan")
+        for arr in [[1, nan, 3], [nan, 1, 3], [1, 3, nan], [1.5, 2, -0.0, 0]]:
+            with self.subTest(array=arr):
+                expected = sorted(arr, key=self.total_order, reverse=True)
+                for backend in ["radix", "auto"]:
+                    data = arr.copy()
+                    with mock.patch.object(sort_module, "np", None):
+                        result = insertion_sort_decreasing(arr, backend=backend)
+                        insertion_sort_decreasing_inplace(data, backend=backend)
+                    self.assertSameFloats(result, expected)
+                    self.assertSameFloats(data, expected)
+    
+    def test_other_buffers_use_strategy(self):
+        """Test that non-double buffers and inexact int/float mixes are not sent down the float path."""
+        data = array("f", [1.5, 3.5, 2.5])
+        insertion_sort_decreasing_inplace(data, backend="radix")
+        self.assertEqual(data.tolist(), [3.5, 2.5, 1.5])
+        big = 2**53 + 1
+        self.assertEqual(insertion_sort_decreasing([1.5, big, 0.5], backend="radix"),
+                         [big, 1.5, 0.5])
+
+
+class TestSortedDescending(unittest.TestCase):
+    """Test cases for the SortedDescending incremental buffer."""
+    
+    def test_add_keeps_decreasing_order(self):
+        """Test that values added one at a time are kept in decreasing order."""
+        buffer = SortedDescending()
+        for value in [5, 2, 8, 1, 9, 3]:
+            buffer.add(value)
+        
+        self.assertEqual(list(buffer), [9, 8, 5, 3, 2, 1])
+        self.assertEqual(len(buffer), 6)
+        self.assertEqual(list(reversed(buffer)), [1, 2, 3, 5, 8, 9])
+    
+    def test_matches_full_sort(self):
+        """Test random adds and extends against insertion_sort_decreasing."""
+        rng = random.Random(17)
+        for block_size in [1, 4, 1000]:
+            with self.subTest(block_size=block_size):
+                buffer = SortedDescending(block_size=block_size)
+                values = []
+                for _ in range(50):
+                    if rng.random() < 0.8:
+                        value = rng.randint(-100, 100)
+                        buffer.add(value)
+                        values.append(value)
+                    else:
+                        batch = [rng.randint(-100, 100) for _ in range(rng.randint(0, 30))]
+                        buffer.extend(batch)
+                        values.extend(batch)
+                    self.assertEqual(list(buffer), insertion_sort_decreasing(values))
+    
+    def test_getitem(self):
+        """Test positive, negative and slice indexing."""
+        buffer = SortedDescending(range(100), block_size=3)
+        self.assertEqual(buffer[0], 99)
+        self.assertEqual(buffer[50], 49)
+        self.assertEqual(buffer[-1], 0)
+        self.assertEqual(buffer[:3], [99, 98, 97])
+        self.assertEqual(buffer[::-40], [0, 40, 80])
+        
+        with self.assertRaises(IndexError):
+            buffer[100]
+        
+        with self.assertRaises(IndexError):
+            buffer[-101]
+    
+    def test_pop_max(self):
+        """Test that pop_max removes the largest values first."""
+        buffer = SortedDescending([3, 7, 1, 7, 5], block_size=2)
+        self.assertEqual([buffer.pop_max() for _ in range(5)], [7, 7, 5, 3, 1])
+        self.assertEqual(len(buffer), 0)
+        
+        with self.assertRaises(IndexError):
+            buffer.pop_max()
+    
+    def test_stability(self):
+        """Test that equal values keep their insertion order."""
+        buffer = SortedDescending(block_size=2)
+        for key, tag in [(5, 'a'), (3, 'b'), (5, 'c'), (3, 'd'), (5, 'e')]:
+            buffer.add(Keyed(key, tag))
+        buffer.extend([Keyed(5, 'f'), Keyed(3, 'g')])
+        
+        self.assertEqual([item.tag for item in buffer], ['a', 'c', 'e', 'f', 'b', 'd', 'g'])
+        self.assertEqual(buffer.pop_max().tag, 'a')
+    
+    def test_large_buffer(self):
+        """Test a buffer large enough to span many blocks."""
+        rng = random.Random(19)
+        values = [rng.random() for _ in range(20000)]
+        buffer = SortedDescending()
+        for value in values:
+            buffer.add(value)
+        
+        self.assertEqual(list(buffer), sorted(values, reverse=True))
+        self.assertEqual(buffer[12345], sorted(values, reverse=True)[12345])
+    
+    def test_invalid_block_size(self):
+        """Test that a non-positive block size raises ValueError."""
+        with self.assertRaises(ValueError):
+            SortedDescending(block_size=0)
+
+
+class TestTopK(unittest.TestCase):
+    """Test cases for top_k_decreasing."""
+    
+    def test_basic_top_k(self):
+        """Test that the k largest elements come back in decreasing order."""
+        test_cases = [
+            ([5, 2, 8, 1, 9, 3], 3, [9, 8, 5]),
+            ([5, 2, 8, 1, 9, 3], 1, [9]),
+            ([3, 1, 4, 1, 5, 9, 2, 6], 8, [9, 6, 5, 4, 3, 2, 1, 1]),
+            ([3, 3, 3, 3], 2, [3, 3]),
+            ([1, 2, 3], 10, [3, 2, 1]),
+            ([], 3, []),
+            ([5, 2, 8], 0, []),
+        ]
+        
+        for input_arr, k, expected in test_cases:
+            with self.subTest(input_arr=input_arr, k=k):
+                self.assertEqual(top_k_decreasing(input_arr, k), expected)
+    
+    def test_matches_prefix_of_full_sort(self):
+        """Test that the result equals the first k elements of the full sort."""
+        rng = random.Random(23)
+        for size in [0, 5, 100, 2000]:
+            arr = [rng.randint(0, 50) for _ in range(size)]
+            expected = insertion_sort_decreasing(arr, strategy="hybrid")
+            for k in [1, 10, 1000]:
+                with self.subTest(size=size, k=k):
+                    self.assertEqual(top_k_decreasing(arr, k), expected[:k])
+    
+    def test_stable_tie_order(self):
+        """Test that ties are resolved exactly as in the full stable sort."""
+        items = [Keyed(k, t) for t, k in enumerate([2, 5, 1, 5, 2, 5, 2, 0])]
+        expected = insertion_sort_decreasing(items)
+        for k in range(len(items) + 1):
+            with self.subTest(k=k):
+                result = top_k_decreasing(items, k)
+                self.assertEqual([item.tag for item in result], [item.tag for item in expected[:k]])
+    
+    def test_accepts_iterators(self):
+        """Test that any iterable, including a generator, can be streamed."""
+        self.assertEqual(top_k_decreasing((x * x % 17 for x in range(100)), 3), [16, 16, 16])
+        self.assertEqual(top_k_decreasing(iter([4, 8, 6]), 2), [8, 6])
+    
+    def test_negative_k(self):
+        """Test that a negative k raises ValueError."""
+        with self.assertRaises(ValueError):
+            top_k_decreasing([1, 2, 3], -1)
+
+
+class TestIterDecreasing(unittest.TestCase):
+    """Test the lazy iter_decreasing generator."""
+    
+    class Counted(Keyed):
+        comparisons = 0
+        
+        def __lt__(self, other):
+            TestIterDecreasing.Counted.comparisons += 1
+            return super().__lt__(other)
+    
+    def test_matches_sort(self):
+        """Test full iteration against insertion_sort_decreasing."""
+        rng = random.Random(193)
+        for size in [0, 1, 2, 10, 257]:
+            for values in ([rng.randint(0, 9) for _ in range(size)],
+                           [rng.uniform(-1, 1) for _ in range(size)],
+                           [str(rng.randint(0, 99)) for _ in range(size)]):
+                with self.subTest(size=size, kind=type(values[0]).__name__ if values else None):
+                    self.assertEqual(list(iter_decreasing(values)), insertion_sort_decreasing(values))
+    
+    def test_stable_ties(self):
+        """Test that equal elements come out in their original order."""
+        rng = random.Random(197)
+        items = [self.Counted(rng.randint(0, 5), tag) for tag in range(500)]
+        expected = [item.tag for item in insertion_sort_decreasing(items, strategy="hybrid")]
+        self.assertEqual([item.tag for item in iter_decreasing(items)], expected)
+        
+        numbers = [1, 0.0, 2, -0.0, 1.0, 0, 2.0]
+        self.assertEqual([repr(v) for v in iter_decreasing(numbers)],
+                         [repr(v) for v in sorted(numbers, reverse=True)])
+    
+    def test_generator_input(self):
+        """Test that any iterable, including a generator, is accepted."""
+        self.assertEqual(list(iter_decreasing(x * 7 % 11 for x in range(11))), list(range(10, -1, -1)))
+        self.assertEqual(list(iter_decreasing(iter(()))), [])
+    
+    def test_lazy_prefix_is_cheap(self):
+        """Test that reading the first few results costs O(n + k log n) comparisons."""
+        rng = random.Random(199)
+        items = [self.Counted(rng.random(), tag) for tag in range(4096)]
+        self.Counted.comparisons = 0
+        first = list(itertools.islice(iter_decreasing(items), 5))
+        self.assertEqual([item.key for item in first],
+                         sorted((item.key for item in items), reverse=True)[:5])
+        # heapify needs at most 2n entry comparisons and each pop about
+        # 2 log2 n; an entry comparison calls < at most twice. A full sort
+        # would need about n log2 n = 49152.
+        self.assertLess(self.Counted.comparisons, 2 * (2 * 4096 + 5 * 2 * 12))
+
+
+class TestKeyFunction(unittest.TestCase):
+    """Test cases for the key= parameter of both sort functions."""
+    
+    RECORDS = [
+        {"name": "a", "score": 5},
+        {"name": "b", "score": 3},
+        {"name": "c", "score": 5},
+        {"name": "d", "score": 3},
+        {"name": "e", "score": 9},
+    ]
+    
+    def test_sort_records_by_field(self):
+        """Test sorting records by a field without wrapper objects."""
+        for strategy in ["linear", "binary", "hybrid"]:
+            with self.subTest(strategy=strategy):
+                result = insertion_sort_decreasing(self.RECORDS, strategy=strategy,
+                                                   key=lambda record: record["score"])
+                self.assertEqual([record["name"] for record in result], ['e', 'a', 'c', 'b', 'd'])
+    
+    def test_key_called_once_per_element(self):
+        """Test that the key function runs exactly once per element."""
+        calls = []
+        
+        def key(value):
+            calls.append(value)
+            return -value
+        
+        arr = list(range(50))
+        random.Random(29).shuffle(arr)
+        result = insertion_sort_decreasing(arr, key=key)
+        self.assertEqual(result, list(range(50)))
+        self.assertEqual(sorted(calls), list(range(50)))
+        
+        calls.clear()
+        insertion_sort_decreasing_inplace(arr, strategy="binary", key=key)
+        self.assertEqual(len(calls), 50)
+    
+    def test_elements_are_never_compared(self):
+        """Test that only keys are compared, so non-comparable elements work."""
+        class NonComparable:
+            def __init__(self, value):
+                self.value = value
+        
+        objects = [NonComparable(v) for v in [2, 7, 2, 5]]
+        result = insertion_sort_decreasing(objects, key=lambda obj: obj.value)
+        self.assertEqual([obj.value for obj in result], [7, 5, 2, 2])
+        self.assertIs(result[2], objects[0])
+        self.assertIs(result[3], objects[2])
+    
+    def test_inplace_permutes_original_list(self):
+        """Test that in-place key sorting reorders the same list and objects."""
+        records = list(self.RECORDS)
+        originals = {id(record) for record in records}
+        result = insertion_sort_decreasing_inplace(records, key=lambda record: record["score"])
+        
+        self.assertIs(result, records)
+        self.assertEqual({id(record) for record in records}, originals)
+        self.assertEqual([record["name"] for record in records], ['e', 'a', 'c', 'b', 'd'])
+    
+    def test_matches_builtin_stable_sort(self):
+        """Test random inputs against Python's stable sort on the same key."""
+        rng = random.Random(31)
+        for size in [0, 1, 10, 300]:
+            arr = [(rng.randint(0, 9), rng.random()) for _ in range(size)]
+            expected = sorted(arr, key=lambda item: item[0], reverse=True)
+            for backend in ["python", "auto"]:
+                with self.subTest(size=size, backend=backend):
+                    self.assertEqual(
+                        insertion_sort_decreasing(arr, strategy="hybrid", backend=backend,
+                                                  key=lambda item: item[0]),
+                        expected,
+                    )
+                    arr_copy = arr.copy()
+                    insertion_sort_decreasing_inplace(arr_copy, backend=backend,
+                                                      key=lambda item: item[0])
+                    self.assertEqual(arr_copy, expected)
+    
+    def test_less_than_only_keys_are_stable(self):
+        """Test that keys defining only < keep ties in input order on every strategy."""
+        rng = random.Random(37)
+        records = [(rng.randint(0, 5), tag) for tag in range(200)]
+        expected = sorted(records, key=lambda record: record[0], reverse=True)
+        key = lambda record: Keyed(record[0], record[1])
+        for strategy in sort_module._STRATEGIES:
+            with self.subTest(strategy=strategy):
+                self.assertEqual(insertion_sort_decreasing(records, strategy=strategy, key=key),
+                                 expected)
+                data = records.copy()
+                insertion_sort_decreasing_inplace(data, strategy=strategy, key=key)
+                self.assertEqual(data, expected)
+                perm = argsort_decreasing(records, strategy=strategy, key=key)
+                self.assertEqual([records[i] for i in perm], expected)
+
+
+class TestParallelSort(unittest.TestCase):
+    """Test cases for the multi-process parallel_sort_decreasing entry point."""
+    
+    def test_integer_payload_through_shared_memory(self):
+        """Test int64 input, which is sorted through shared memory."""
+        rng = random.Random(37)
+        arr = [rng.randint(-10**12, 10**12) for _ in range(5000)]
+        result = parallel_sort_decreasing(arr, workers=2, min_size=0)
+        self.assertEqual(result, insertion_sort_decreasing(arr, strategy="hybrid"))
+    
+    def test_float_payload_through_shared_memory(self):
+        """Test float input with uneven chunks."""
+        rng = random.Random(41)
+        arr = [rng.uniform(-1, 1) for _ in range(3001)]
+        result = parallel_sort_decreasing(arr, workers=2, chunk_size=700, min_size=0)
+        self.assertEqual(result, sorted(arr, reverse=True))
+    
+    def test_generic_objects_are_stable(self):
+        """Test pickled (non-numeric) chunks and stability across chunk boundaries."""
+        rng = random.Random(43)
+        arr = [(rng.randint(0, 3), rng.choice("abc")) for _ in range(1000)]
+        result = parallel_sort_decreasing(arr, workers=2, chunk_size=300, min_size=0,
+                                          strategy="binary")
+        self.assertEqual(result, insertion_sort_decreasing(arr, strategy="hybrid"))
+    
+    def test_small_input_uses_serial_path(self):
+        """Test that small inputs are sorted without starting worker processes."""
+        with mock.patch.object(sort_module, "ProcessPoolExecutor") as pool:
+            result = parallel_sort_decreasing([5, 2, 8, 1, 9, 3], workers=4)
+            self.assertEqual(parallel_sort_decreasing([], workers=4, min_size=0), [])
+        self.assertEqual(result, [9, 8, 5, 3, 2, 1])
+        pool.assert_not_called()
+    
+    def test_input_unchanged(self):
+        """Test that the input list is not modified."""
+        arr = [3, 1, 2] * 100
+        original = arr.copy()
+        parallel_sort_decreasing(arr, workers=2, min_size=0)
+        self.assertEqual(arr, original)
+    
+    def test_invalid_parameters(self):
+        """Test that invalid worker counts and chunk sizes raise ValueError."""
+        with self.assertRaises(ValueError):
+            parallel_sort_decreasing([1, 2, 3], workers=0)
+        
+        with self.assertRaises(ValueError):
+            parallel_sort_decreasing([1, 2, 3], chunk_size=0)
+
+
+class TestAsyncSort(unittest.TestCase):
+    """Test the event-loop friendly insertion_sort_decreasing_async."""
+    
+    def test_matches_sync_sort(self):
+        """Test sizes around the cutoff and a tiny time budget."""
+        rng = random.Random(113)
+        for size in [0, 1, 2, 31, 32, 33, 500, 5000]:
+            arr = [rng.randint(0, size // 4 + 1) for _ in range(size)]
+            original = arr.copy()
+            with self.subTest(size=size):
+                result = asyncio.run(insertion_sort_decreasing_async(arr, time_budget=1e-5))
+                self.assertEqual(result, sorted(arr, reverse=True))
+                self.assertEqual(arr, original)
+    
+    def test_stable_and_inplace(self):
+        """Test that ties keep their order and inplace=True sorts the given list."""
+        rng = random.Random(127)
+        items = [Keyed(rng.randint(0, 9), tag) for tag in range(3000)]
+        expected = [item.tag for item in sorted(items, key=lambda item: -item.key)]
+        result = asyncio.run(insertion_sort_decreasing_async(items, inplace=True, time_budget=1e-5))
+        self.assertIs(result, items)
+        self.assertEqual([item.tag for item in items], expected)
+    
+    def test_yields_to_event_loop(self):
+        """Test that other tasks run while a large sort is in progress."""
+        async def scenario():
+            ticks = 0
+            
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0)
+            
+            task = asyncio.create_task(ticker())
+            rng = random.Random(131)
+            arr = [rng.random() for _ in range(50000)]
+            result = await insertion_sort_decreasing_async(arr, time_budget=0.001)
+            task.cancel()
+            return result, ticks
+        
+        result, ticks = asyncio.run(scenario())
+        self.assertEqual(result, sorted(result, reverse=True))
+        self.assertGreater(ticks, 10)
+    
+    def test_progress_callback(self):
+        """Test that progress is monotone and ends at 1.0."""
+        reports = []
+        rng = random.Random(137)
+        arr = [rng.random() for _ in range(20000)]
+        asyncio.run(insertion_sort_decreasing_async(arr, time_budget=1e-4, progress=reports.append))
+        self.assertGreater(len(reports), 2)
+        self.assertEqual(reports, sorted(reports))
+        self.assertEqual(reports[-1], 1.0)
+        self.assertTrue(all(0.0 <= fraction <= 1.0 for fraction in reports))
+    
+    def test_cancellation_keeps_elements(self):
+        """Test that cancelling an in-place sort mid-merge loses no elements."""
+        rng = random.Random(139)
+        arr = [rng.random() for _ in range(30000)]
+        original = sorted(arr)
+        
+        async def scenario():
+            task = None
+            
+            def cancel_late(fraction):
+                if fraction > 0.6:
+                    task.cancel()
+            
+            task = asyncio.ensure_future(insertion_sort_decreasing_async(
+                arr, inplace=True, time_budget=1e-5, progress=cancel_late))
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+        
+        asyncio.run(scenario())
+        self.assertEqual(sorted(arr), original)
+        self.assertNotEqual(arr, sorted(arr, reverse=True))
+    
+    def test_offload_to_executor(self):
+        """Test that large inputs go to the executor instead of the loop."""
+        arr = [5, 2, 8, 1, 9, 3] * 50
+        expected = sorted(arr, reverse=True)
+        for executor_type in [ThreadPoolExecutor, ProcessPoolExecutor]:
+            with self.subTest(executor=executor_type.__name__):
+                data = arr.copy()
+                with executor_type(max_workers=1) as executor, \
+                        mock.patch.object(sort_module, "_hybrid_steps") as steps:
+                    result = asyncio.run(insertion_sort_decreasing_async(
+                        data, inplace=True, executor=executor, offload_threshold=100))
+                steps.assert_not_called()
+                self.assertIs(result, data)
+                self.assertEqual(data, expected)
+    
+    def test_small_input_stays_on_loop(self):
+        """Test that inputs below the threshold are not offloaded."""
+        executor = mock.Mock()
+        result = asyncio.run(insertion_sort_decreasing_async([1, 3, 2], executor=executor))
+        self.assertEqual(result, [3, 2, 1])
+        executor.submit.assert_not_called()
+    
+    def test_invalid_parameters(self):
+        """Test that a non-positive budget or cutoff raises ValueError."""
+        with self.assertRaises(ValueError):
+            asyncio.run(insertion_sort_decreasing_async([1, 2], time_budget=0))
+        with self.assertRaises(ValueError):
+            asyncio.run(insertion_sort_decreasing_async([1, 2], cutoff=0))
+
+
+class TestExternalSort(unittest.TestCase):
+    """Test cases for the out-of-core external_sort_decreasing mode."""
+    
+    def setUp(self):
+        self.workdir = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self.workdir.name, "input.bin")
+        self.output_path = os.path.join(self.workdir.name, "output.bin")
+    
+    def tearDown(self):
+        self.workdir.cleanup()
+    
+    def write_input(self, values, typecode="q"):
+        with open(self.input_path, "wb") as f:
+            array(typecode, values).tofile(f)
+    
+    def read_output(self, typecode="q"):
+        result = array(typecode)
+        with open(self.output_path, "rb") as f:
+            result.frombytes(f.read())
+        return result.tolist()
+    
+    def test_single_block(self):
+        """Test input that fits in memory: one pass, no merge."""
+        self.write_input([5, 2, 8, 1, 9, 3])
+        passes = external_sort_decreasing(self.input_path, self.output_path)
+        
+        self.assertEqual(self.read_output(), [9, 8, 5, 3, 2, 1])
+        self.assertEqual(len(passes), 1)
+        self.assertEqual(passes[0]["bytes_read"], 48)
+        self.assertEqual(passes[0]["bytes_written"], 48)
+    
+    def test_multi_pass_merge(self):
+        """Test a memory limit small enough to need several merge passes."""
+        rng = random.Random(47)
+        values = [rng.randint(-2**63, 2**63 - 1) for _ in range(20000)]
+        self.write_input(values)
+        passes = external_sort_decreasing(self.input_path, self.output_path,
+                                          memory_limit=20000, fan_in=4)
+        
+        self.assertEqual(self.read_output(), sorted(values, reverse=True))
+        self.assertGreater(len(passes), 2)
+        self.assertEqual(passes[-1]["runs_out"], 1)
+        for stats in passes:
+            with self.subTest(sort_pass=stats["pass"]):
+                self.assertEqual(stats["bytes_read"], 20000 * 8)
+                self.assertEqual(stats["bytes_written"], 20000 * 8)
+    
+    def test_float_file(self):
+        """Test a file of doubles."""
+        rng = random.Random(53)
+        values = [rng.uniform(-1e9, 1e9) for _ in range(5000)]
+        self.write_input(values, "d")
+        external_sort_decreasing(self.input_path, self.output_path, memory_limit=30000,
+                                 typecode="d")
+        self.assertEqual(self.read_output("d"), sorted(values, reverse=True))
+    
+    def test_empty_file(self):
+        """Test that an empty input produces an empty output."""
+        self.write_input([])
+        external_sort_decreasing(self.input_path, self.output_path)
+        self.assertEqual(self.read_output(), [])
+    
+    def test_invalid_arguments(self):
+        """Test truncated files, tiny memory limits and in-place output."""
+        with open(self.input_path, "wb") as f:
+            f.write(b"\x00" * 12)
+        with self.assertRaises(ValueError):
+            external_sort_decreasing(self.input_path, self.output_path)
+        
+        self.write_input([1, 2, 3])
+        with self.assertRaises(ValueError):
+            external_sort_decreasing(self.input_path, self.output_path, memory_limit=8)
+        
+        with self.assertRaises(ValueError):
+            external_sort_decreasing(self.input_path, self.input_path)
+        
+        with self.assertRaises(ValueError):
+            external_sort_decreasing(self.input_path, self.output_path, fan_in=1)
+
+
+class TestBufferProtocolInplace(unittest.TestCase):
+    """Test in-place sorting of array.array, bytearray and memoryview buffers."""
+    
+    STRATEGIES = ["linear", "binary", "hybrid", "library"]
+    
+    def test_typed_arrays(self):
+        """Test array.array of several typecodes with every strategy."""
+        rng = random.Random(59)
+        for typecode in "bBhHiqQfd":
+            values = [rng.randint(0, 120) for _ in range(200)]
+            expected = sorted(array(typecode, values).tolist(), reverse=True)
+            for strategy in self.STRATEGIES:
+                with self.subTest(typecode=typecode, strategy=strategy):
+                    arr = array(typecode, values)
+                    result = insertion_sort_decreasing_inplace(arr, strategy=strategy)
+                    self.assertIs(result, arr)
+                    self.assertEqual(arr.typecode, typecode)
+                    self.assertEqual(arr.tolist(), expected)
+    
+    def test_bytearray(self):
+        """Test sorting a bytearray in place."""
+        for strategy in self.STRATEGIES:
+            with self.subTest(strategy=strategy):
+                data = bytearray(b"insertion sort")
+                insertion_sort_decreasing_inplace(data, strategy=strategy)
+                self.assertEqual(data, bytearray(sorted(b"insertion sort", reverse=True)))
+    
+    def test_memoryview_writes_through(self):
+        """Test that sorting a memoryview sorts the underlying buffer."""
+        for strategy in self.STRATEGIES:
+            with self.subTest(strategy=strategy):
+                backing = array('d', [0.5, 2.5, -1.0, 9.75, 2.5])
+                view = memoryview(backing)
+                self.assertIs(insertion_sort_decreasing_inplace(view, strategy=strategy), view)
+                self.assertEqual(backing.tolist(), [9.75, 2.5, 2.5, 0.5, -1.0])
+    
+    def test_strided_memoryview(self):
+        """Test that a strided view sorts only the elements it covers."""
+        backing = array('q', range(10))
+        insertion_sort_decreasing_inplace(memoryview(backing)[::2], strategy="hybrid")
+        self.assertEqual(backing.tolist(), [8, 1, 6, 3, 4, 5, 2, 7, 0, 9])
+    
+    def test_shared_memory_view(self):
+        """Test a writable memoryview over a shared memory segment."""
+        rng = random.Random(61)
+        values = [rng.uniform(-100, 100) for _ in range(1000)]
+        shm = shared_memory.SharedMemory(create=True, size=len(values) * 8)
+        try:
+            view = shm.buf.cast('d')
+            view[:len(values)] = array('d', values)
+            hybrid_sort_decreasing_inplace(view[:len(values)], buffer_size=16)
+            self.assertEqual(view[:len(values)].tolist(), sorted(values, reverse=True))
+            view.release()
+        finally:
+            shm.close()
+            shm.unlink()
+    
+    def test_invalid_buffers(self):
+        """Test read-only, multi-dimensional and unsupported-format buffers."""
+        with self.assertRaises(TypeError):
+            insertion_sort_decreasing_inplace(memoryview(b"readonly"))
+        
+        with self.assertRaises(TypeError):
+            insertion_sort_decreasing_inplace(memoryview(bytearray(8)).cast('B', (2, 4)))
+        
+        with self.assertRaises(TypeError):
+            insertion_sort_decreasing_inplace(memoryview(bytearray(4)).cast('c'))
+        
+        with self.assertRaises(TypeError):
+            insertion_sort_decreasing_inplace(b"bytes are immutable")
+
+
+class TestSortStats(unittest.TestCase):
+    """Test cases for the opt-in sort_with_stats instrumentation."""
+    
+    def test_result_matches_sort(self):
+        """Test that instrumented sorting returns the normal result."""
+        arr = [5, 2, 8, 1, 9, 3]
+        for strategy in ["linear", "binary", "hybrid"]:
+            with self.subTest(strategy=strategy):
+                result, stats = sort_with_stats(arr, strategy=strategy)
+                self.assertEqual(result, [9, 8, 5, 3, 2, 1])
+                self.assertEqual(arr, [5, 2, 8, 1, 9, 3])
+                self.assertIsInstance(stats, SortStats)
+                self.assertEqual(stats.strategy, strategy)
+                self.assertEqual(stats.n, 6)
+    
+    def test_inplace(self):
+        """Test that inplace=True sorts and returns the original list."""
+        arr = [1, 3, 2]
+        result, _ = sort_with_stats(arr, inplace=True)
+        self.assertIs(result, arr)
+        self.assertEqual(arr, [3, 2, 1])
+    
+    def test_inplace_typed_buffers(self):
+        """Test that inplace=True writes back into array, bytearray and memoryview storage."""
+        for strategy in ["linear", "hybrid"]:
+            with self.subTest(strategy=strategy):
+                ints = array("q", [1, 3, 2])
+                result, stats = sort_with_stats(ints, strategy=strategy, inplace=True)
+                self.assertIs(result, ints)
+                self.assertEqual(ints, array("q", [3, 2, 1]))
+                self.assertEqual(stats.inversions, 2)
+                
+                raw = bytearray(b"bca")
+                self.assertIs(sort_with_stats(raw, strategy=strategy, inplace=True)[0], raw)
+                self.assertEqual(raw, bytearray(b"cba"))
+                
+                backing = array("d", [0.5, 2.5, -1.0])
+                view = memoryview(backing)
+                self.assertIs(sort_with_stats(view, strategy=strategy, inplace=True)[0], view)
+                self.assertEqual(backing.tolist(), [2.5, 0.5, -1.0])
+        
+        with self.assertRaises(TypeError):
+            sort_with_stats(memoryview(b"abc"), inplace=True)
+    
+    def test_linear_counts_on_ascending_input(self):
+        """Test exact counts for ascending input, which is reversed in O(n)."""
+        n = 50
+        _, stats = sort_with_stats(list(range(n)), strategy="linear")
+        self.assertEqual(stats.inversions, n * (n - 1) // 2)
+        self.assertEqual(stats.comparisons, n - 1)
+        self.assertEqual(stats.moves, n)  # one slice write reversing the run
+        self.assertEqual(stats.outer_iterations, 0)
+    
+    def test_linear_counts_on_worst_case_input(self):
+        """Test exact counts when every element must travel to the front."""
+        n = 50
+        arr = [1, 0] + list(range(2, n))
+        _, stats = sort_with_stats(arr, strategy="linear")
+        # Leading run [1, 0], then element i shifts past all i earlier ones
+        shifts = sum(range(2, n))
+        self.assertEqual(stats.inversions, shifts)
+        self.assertEqual(stats.comparisons, 2 + shifts)
+        self.assertEqual(stats.moves, shifts + n - 2)
+        self.assertEqual(stats.outer_iterations, n - 2)
+    
+    def test_inversions_match_brute_force(self):
+        """Test the inversion count against a quadratic reference."""
+        rng = random.Random(67)
+        arr = [rng.randint(0, 20) for _ in range(120)]
+        expected = sum(1 for i in range(len(arr)) for j in range(i + 1, len(arr)) if arr[i] < arr[j])
+        _, stats = sort_with_stats(arr, strategy="hybrid")
+        self.assertEqual(stats.inversions, expected)
+    
+    def test_binary_uses_fewer_comparisons(self):
+        """Test that the stats expose the binary strategy's comparison savings."""
+        arr = list(range(300))
+        random.Random(71).shuffle(arr)
+        _, linear = sort_with_stats(arr, strategy="linear", trace_memory=False)
+        _, binary = sort_with_stats(arr, strategy="binary", trace_memory=False)
+        self.assertLess(binary.comparisons * 5, linear.comparisons)
+        self.assertEqual(binary.inversions, linear.inversions)
+    
+    def test_callback_once_per_outer_iteration(self):
+        """Test that the callback runs once per outer iteration."""
+        snapshots = []
+        _, stats = sort_with_stats([1, 4, 3, 2, 5, 0], strategy="binary",
+                                   callback=lambda s: snapshots.append(s.outer_iterations))
+        # [1, 4] is the leading run; 3, 2, 5 and 0 are each inserted once
+        self.assertEqual(snapshots, [1, 2, 3, 4])
+        self.assertEqual(stats.outer_iterations, 4)
+    
+    def test_timing_and_memory(self):
+        """Test that wall time and peak extra memory are recorded."""
+        _, stats = sort_with_stats(list(range(2000)), strategy="hybrid")
+        self.assertGreater(stats.wall_time, 0)
+        self.assertGreater(stats.peak_extra_memory, 0)
+        
+        _, stats = sort_with_stats([3, 1, 2], trace_memory=False)
+        self.assertEqual(stats.peak_extra_memory, 0)
+    
+    def test_memory_excludes_instrumentation(self):
+        """Test that slice writes are counted without copying them again."""
+        rng = random.Random(139)
+        arr = [rng.random() for _ in range(2000)]
+        _, stats = sort_with_stats(arr, strategy="binary")
+        # Binary insertion holds one shifted slice and CPython's buffer for the
+        # items it replaces, two pointers per element; a third would be a copy.
+        self.assertLess(stats.peak_extra_memory, 20 * len(arr))
+    
+    def test_uninstrumented_path_unchanged(self):
+        """Test that the plain sort functions never touch the instrumentation."""
+        with mock.patch.object(sort_module, "_observed_range", side_effect=AssertionError):
+            self.assertEqual(insertion_sort_decreasing([1, 3, 2], strategy="hybrid"), [3, 2, 1])
+
+
+class TestPresortedInput(unittest.TestCase):
+    """Test the O(n) fast paths for presorted input."""
+    
+    STRATEGIES = ["linear", "binary", "hybrid", "library"]
+    
+    def test_descending_input_is_left_alone(self):
+        """Test that fully descending input costs n - 1 comparisons and no moves."""
+        arr = list(range(500, 0, -1))
+        for strategy in self.STRATEGIES:
+            with self.subTest(strategy=strategy):
+                result, stats = sort_with_stats(arr, strategy=strategy, trace_memory=False)
+                self.assertEqual(result, arr)
+                self.assertEqual(stats.comparisons, 499)
+                self.assertEqual(stats.moves, 0)
+    
+    def test_ascending_input_is_reversed(self):
+        """Test that strictly ascending input is reversed in linear time."""
+        arr = list(range(500))
+        for strategy in self.STRATEGIES:
+            with self.subTest(strategy=strategy):
+                result, stats = sort_with_stats(arr, strategy=strategy, trace_memory=False)
+                self.assertEqual(result, list(range(499, -1, -1)))
+                self.assertEqual(stats.comparisons, 499)
+                self.assertLessEqual(stats.moves, 500)
+    
+    def test_non_strict_ascending_run_stays_stable(self):
+        """Test that ascending runs with ties are not blindly reversed."""
+        items = [Keyed(k, t) for t, k in enumerate([1, 2, 2, 3, 3, 3, 4])]
+        for strategy in self.STRATEGIES:
+            with self.subTest(strategy=strategy):
+                result = insertion_sort_decreasing(items, strategy=strategy)
+                self.assertEqual([item.tag for item in result], [6, 3, 4, 5, 1, 2, 0])
+    
+    def test_hybrid_reuses_natural_runs(self):
+        """Test that long descending runs are merged rather than re-sorted."""
+        rng = random.Random(73)
+        runs = [sorted((rng.random() for _ in range(2000)), reverse=True) for _ in range(4)]
+        arr = [value for run in runs for value in run]
+        result, stats = sort_with_stats(arr, strategy="hybrid", trace_memory=False)
+        self.assertEqual(result, sorted(arr, reverse=True))
+        # Run detection (n) plus two merge levels (about n each), far below n log n
+        self.assertLess(stats.comparisons, 4 * len(arr))
+    
+    def test_mixed_runs_match_full_sort(self):
+        """Test inputs made of ascending, descending and flat runs."""
+        rng = random.Random(79)
+        for _ in range(20):
+            arr = []
+            for _ in range(rng.randint(1, 8)):
+                run = [rng.randint(0, 30) for _ in range(rng.randint(1, 60))]
+                arr.extend(sorted(run, reverse=rng.random() < 0.5))
+            expected = sorted(arr, reverse=True)
+            for strategy in self.STRATEGIES:
+                with self.subTest(strategy=strategy, size=len(arr)):
+                    self.assertEqual(insertion_sort_decreasing(arr, strategy=strategy), expected)
+
+
+class TestShellSort(unittest.TestCase):
+    """Test the in-place Shell sort and its gap sequences."""
+    
+    def test_gap_sequences(self):
+        """Test the published prefixes of each gap sequence."""
+        self.assertEqual(GAP_SEQUENCES["ciura"](1000)[:8], [1, 4, 10, 23, 57, 132, 301, 701])
+        self.assertEqual(GAP_SEQUENCES["tokuda"](1000)[:8], [1, 4, 9, 20, 46, 103, 233, 525])
+        self.assertEqual(GAP_SEQUENCES["sedgewick"](1000)[:6], [1, 8, 23, 77, 281, 1073])
+    
+    def test_sequences_extend_past_n(self):
+        """Test that every sequence grows to cover large inputs."""
+        for name, gaps in GAP_SEQUENCES.items():
+            with self.subTest(gaps=name):
+                sequence = gaps(10**6)
+                self.assertGreaterEqual(sequence[-1], 10**6)
+                self.assertEqual(sequence, sorted(set(sequence)))
+    
+    def test_matches_sorted(self):
+        """Test every gap sequence against sorted() on random input."""
+        rng = random.Random(83)
+        for name in GAP_SEQUENCES:
+            for size in [0, 1, 2, 3, 10, 57, 500, 3000]:
+                arr = [rng.randint(-100, 100) for _ in range(size)]
+                with self.subTest(gaps=name, size=size):
+                    data = arr.copy()
+                    result = shell_sort_decreasing_inplace(data, gaps=name)
+                    self.assertIs(result, data)
+                    self.assertEqual(data, sorted(arr, reverse=True))
+    
+    def test_strategy_in_both_functions(self):
+        """Test strategy="shell" through the public API."""
+        arr = [64, 34, 25, 12, 22, 11, 90, 5]
+        expected = sorted(arr, reverse=True)
+        self.assertEqual(insertion_sort_decreasing(arr, strategy="shell"), expected)
+        data = arr.copy()
+        insertion_sort_decreasing_inplace(data, strategy="shell")
+        self.assertEqual(data, expected)
+    
+    def test_key_restores_stability(self):
+        """Test that key= keeps ties in order even though shell sort is unstable."""
+        records = [(i % 5, i) for i in range(200)]
+        result = insertion_sort_decreasing(records, strategy="shell", key=lambda r: r[0])
+        self.assertEqual(result, sorted(records, key=lambda r: r[0], reverse=True))
+    
+    def test_typed_buffers(self):
+        """Test sorting array.array and memoryview storage in place."""
+        rng = random.Random(89)
+        values = [rng.randint(-1000, 1000) for _ in range(700)]
+        data = array("q", values)
+        shell_sort_decreasing_inplace(data, gaps="tokuda")
+        self.assertEqual(data.tolist(), sorted(values, reverse=True))
+        raw = array("d", values)
+        shell_sort_decreasing_inplace(memoryview(raw), gaps="sedgewick")
+        self.assertEqual(raw.tolist(), sorted(map(float, values), reverse=True))
+    
+    def test_custom_gap_callable(self):
+        """Test a user-supplied gap sequence."""
+        rng = random.Random(97)
+        arr = [rng.random() for _ in range(300)]
+        halving = lambda n: [2**k for k in range(n.bit_length())]
+        self.assertEqual(
+            shell_sort_decreasing_inplace(arr.copy(), gaps=halving), sorted(arr, reverse=True)
+        )
+    
+    def test_no_extra_memory(self):
+        """Test that the extra memory stays flat when the input doubles."""
+        rng = random.Random(101)
+        peaks = []
+        for size in [1000, 2000]:
+            arr = [rng.random() for _ in range(size)]
+            _, stats = sort_with_stats(arr, strategy="shell")
+            peaks.append(stats.peak_extra_memory)
+        self.assertLess(peaks[0], 4096)
+        self.assertLess(peaks[1], peaks[0] + 512)
+    
+    def test_invalid_gaps(self):
+        """Test that unknown or malformed gap sequences raise ValueError."""
+        with self.assertRaises(ValueError):
+            shell_sort_decreasing_inplace([3, 1, 2], gaps="knuth")
+        with self.assertRaises(ValueError):
+            shell_sort_decreasing_inplace([3, 1, 2], gaps=lambda n: [2, 5])
+
+
+class TestLibrarySort(unittest.TestCase):
+    """Test library sort (gapped insertion sort)."""
+    
+    def test_matches_sorted(self):
+        """Test several memory overhead factors against sorted() on random input."""
+        rng = random.Random(211)
+        for epsilon in [0.1, 0.5, DEFAULT_LIBRARY_EPSILON, 3.0]:
+            for size in [0, 1, 2, 3, 10, 57, 500, 3000]:
+                arr = [rng.randint(-100, 100) for _ in range(size)]
+                with self.subTest(epsilon=epsilon, size=size):
+                    data = arr.copy()
+                    result = library_sort_decreasing_inplace(data, epsilon=epsilon)
+                    self.assertIs(result, data)
+                    self.assertEqual(data, sorted(arr, reverse=True))
+    
+    def test_stable(self):
+        """Test that equal elements keep their input order."""
+        rng = random.Random(223)
+        records = [Keyed(rng.randint(0, 5), i) for i in range(400)]
+        for epsilon in [0.1, 1.0]:
+            with self.subTest(epsilon=epsilon):
+                result = library_sort_decreasing_inplace(records.copy(), epsilon=epsilon)
+                expected = sorted(records, key=lambda r: r.key, reverse=True)
+                self.assertEqual([r.tag for r in result], [r.tag for r in expected])
+    
+    def test_strategy_in_both_functions(self):
+        """Test strategy="library" through the public API, key= included."""
+        arr = [64, 34, 25, 12, 22, 11, 90, 5]
+        expected = sorted(arr, reverse=True)
+        self.assertEqual(insertion_sort_decreasing(arr, strategy="library"), expected)
+        data = arr.copy()
+        insertion_sort_decreasing_inplace(data, strategy="library")
+        self.assertEqual(data, expected)
+        words = ["pear", "fig", "apple", "kiwi", "plum"]
+        self.assertEqual(
+            insertion_sort_decreasing(words, strategy="library", key=len),
+            sorted(words, key=len, reverse=True),
+        )
+    
+    def test_clustered_input(self):
+        """Test that clustered input does not degrade toward quadratic moves."""
+        arr = list(range(2000)) + list(range(2000, 0, -1))
+        _, stats = sort_with_stats(arr, strategy="library", trace_memory=False)
+        # Reversing the ascending prefix, then one write per element
+        self.assertLessEqual(stats.moves, 2 * len(arr))
+        self.assertLess(stats.comparisons, 40 * len(arr))
+    
+    def test_typed_buffers(self):
+        """Test sorting array.array and memoryview storage in place."""
+        rng = random.Random(227)
+        values = [rng.randint(-1000, 1000) for _ in range(700)]
+        data = array("q", values)
+        library_sort_decreasing_inplace(data, epsilon=0.5)
+        self.assertEqual(data.tolist(), sorted(values, reverse=True))
+        raw = array("d", values)
+        library_sort_decreasing_inplace(memoryview(raw))
+        self.assertEqual(raw.tolist(), sorted(map(float, values), reverse=True))
+    
+    def test_invalid_epsilon(self):
+        """Test that a non-positive memory overhead factor raises ValueError."""
+        for epsilon in [0, -0.5]:
+            with self.subTest(epsilon=epsilon):
+                with self.assertRaises(ValueError):
+                    library_sort_decreasing_inplace([3, 1, 2], epsilon=epsilon)
+
+
+class TestSortMany(unittest.TestCase):
+    """Test batched sorting of many small arrays."""
+    
+    def make_rows(self, seed, count=300):
+        rng = random.Random(seed)
+        rows = [[rng.randint(-50, 50) for _ in range(rng.randint(0, 50))] for _ in range(count)]
+        rows += [[rng.random() for _ in range(8)] for _ in range(count // 3)]
+        rows += [["pear", "apple", "fig"], [True, False, True]]
+        return rows
+    
+    def test_matches_per_row_sort(self):
+        """Test every strategy and backend against sorting each row alone."""
+        rows = self.make_rows(103)
+        expected = [insertion_sort_decreasing(row) for row in rows]
+        backends = ["python", "auto"]
+        for strategy in ["linear", "binary", "hybrid", "shell", "library"]:
+            for backend in backends:
+                with self.subTest(strategy=strategy, backend=backend):
+                    snapshot = [row.copy() for row in rows]
+                    result = sort_many_decreasing(rows, strategy=strategy, backend=backend)
+                    self.assertEqual(result, expected)
+                    self.assertEqual(rows, snapshot)
+    
+    def test_inplace(self):
+        """Test that inplace=True sorts the given row objects."""
+        rows = self.make_rows(107)
+        expected = [sorted(row, reverse=True) for row in rows]
+        for backend in ["python", "auto"]:
+            with self.subTest(backend=backend):
+                data = [row.copy() for row in rows]
+                result = sort_many_decreasing(data, backend=backend, inplace=True)
+                self.assertEqual(data, expected)
+                for returned, original in zip(result, data):
+                    self.assertIs(returned, original)
+    
+    def test_accepts_iterables(self):
+        """Test generators of rows and typed buffer rows."""
+        result = sort_many_decreasing(([3, 9, 1] for _ in range(3)), strategy="binary")
+        self.assertEqual(result, [[9, 3, 1]] * 3)
+        buffers = [array("q", [3, 9, 1]), array("d", [0.5, 2.5])]
+        sort_many_decreasing(buffers, inplace=True)
+        self.assertEqual([row.tolist() for row in buffers], [[9, 3, 1], [2.5, 0.5]])
+        self.assertEqual(sort_many_decreasing([]), [])
+    
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_vectorized_path(self):
+        """Test that equal-length numeric rows are sorted with NumPy."""
+        rng = random.Random(109)
+        rows = [[rng.randint(0, 9) for _ in range(20)] for _ in range(500)]
+        kernel = mock.Mock()
+        with mock.patch.dict(sort_module._STRATEGIES, {"linear": kernel}):
+            result = sort_many_decreasing(rows, backend="numpy")
+        kernel.assert_not_called()
+        self.assertEqual(result, [sorted(row, reverse=True) for row in rows])
+        self.assertTrue(all(type(value) is int for row in result for value in row))
+    
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_vectorized_edge_values(self):
+        """Test NaN, signed zeros, int64 limits and ndarray rows."""
+        nan = float("nan")
+        rows = [[0.0, -0.0, nan, 1.5], [-0.0, nan, 0.0, 2.5], [2**63 - 1, -2**63, 0, 0]]
+        result = sort_many_decreasing(rows, backend="numpy")
+        self.assertEqual(result[2], [2**63 - 1, 0, 0, -2**63])
+        # 0.0 before -0.0 whatever the input order, as in the float total order
+        self.assertEqual([math.copysign(1, v) for v in result[0][1:3]], [1, -1])
+        self.assertEqual([math.copysign(1, v) for v in result[1][1:3]], [1, -1])
+        self.assertTrue(math.isnan(result[0][3]) and math.isnan(result[1][3]))
+        
+        arrays = [np.array([4, 8, 1], dtype=np.int32), np.array([7, 2, 9], dtype=np.int32)]
+        result = sort_many_decreasing(arrays, backend="numpy", inplace=True)
+        self.assertEqual([row.tolist() for row in arrays], [[8, 4, 1], [9, 7, 2]])
+        self.assertEqual(arrays[0].dtype, np.int32)
+    
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_length_groups(self):
+        """Test that list rows are classified per length group, falling back per row."""
+        rng = random.Random(113)
+        rows = [[rng.randint(-9, 9) for _ in range(8)] for _ in range(50)]
+        rows += [[rng.random() for _ in range(5)] for _ in range(50)]
+        with mock.patch.object(sort_module, "_numpy_dtype_for") as classify:
+            result = sort_many_decreasing(rows, backend="auto")
+        classify.assert_not_called()
+        self.assertEqual(result, [sorted(row, reverse=True) for row in rows])
+        
+        # One length, but ints, floats, an exact mix, bools and a huge int
+        rows = [[3, 1, 2], [0.5, 2.5, 1.5], [1, 2.5, 2], [True, False, True], [2**64, 1, 2]]
+        result = sort_many_decreasing(rows, backend="auto")
+        expected = [insertion_sort_decreasing(row, backend="auto") for row in rows]
+        self.assertEqual(result, expected)
+        self.assertEqual([[type(v) for v in row] for row in result],
+                         [[type(v) for v in row] for row in expected])
+    
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_backend_rejects_non_numeric(self):
+        """Test that backend="numpy" raises TypeError for non-numeric rows."""
+        with self.assertRaises(TypeError):
+            sort_many_decreasing([[1, 2], ["a", "b"]], backend="numpy")
+    
+    def test_invalid_strategy(self):
+        """Test that an unknown strategy raises ValueError."""
+        with self.assertRaises(ValueError):
+            sort_many_decreasing([[1, 2]], strategy="bogus")
+
+
+class TestIncrementalResort(unittest.TestCase):
+    """Test restoring order after localized edits with resort_decreasing_inplace."""
+    
+    class CountingWrites(list):
+        writes = 0
+        
+        def __setitem__(self, index, value):
+            if isinstance(index, slice):
+                self.writes += len(range(*index.indices(len(self))))
+            else:
+                self.writes += 1
+            super().__setitem__(index, value)
+    
+    def test_matches_full_sort(self):
+        """Test random edits and appends against a stable full sort, ties included."""
+        rng = random.Random(149)
+        for trial in range(400):
+            size = rng.randint(0, 60)
+            arr = sorted((Keyed(rng.randint(0, 8), tag) for tag in range(size)),
+                         key=lambda item: -item.key)
+            dirty = rng.sample(range(size), rng.randint(0, size))
+            for index in dirty:
+                arr[index] = Keyed(rng.randint(0, 8), 100 + index)
+            tail_start = None
+            if rng.random() < 0.4:
+                tail_start = len(arr)
+                arr.extend(Keyed(rng.randint(0, 8), 1000 + k) for k in range(rng.randint(0, 10)))
+            expected = [item.tag for item in insertion_sort_decreasing(arr, strategy="hybrid")]
+            with self.subTest(trial=trial):
+                result = resort_decreasing_inplace(arr, dirty, tail_start)
+                self.assertIs(result, arr)
+                self.assertEqual([item.tag for item in arr], expected)
+    
+    def test_single_update(self):
+        """Test moving one value to the front, to the back and onto a tie."""
+        arr = [9, 8, 7, 5, 3, 1]
+        arr[4] = 10
+        self.assertEqual(resort_decreasing_inplace(arr, [4]), [10, 9, 8, 7, 5, 1])
+        arr[0] = 0
+        self.assertEqual(resort_decreasing_inplace(arr, [0]), [9, 8, 7, 5, 1, 0])
+        arr[5] = 7
+        self.assertEqual(resort_decreasing_inplace(arr, {5}), [9, 8, 7, 7, 5, 1])
+    
+    def test_appended_tail(self):
+        """Test merging appended values into the sorted prefix."""
+        arr = [50, 40, 30, 20, 10]
+        arr.extend([35, 5, 60, 40])
+        resort_decreasing_inplace(arr, tail_start=5)
+        self.assertEqual(arr, [60, 50, 40, 40, 35, 30, 20, 10, 5])
+    
+    def test_touches_only_affected_range(self):
+        """Test that elements outside the displaced range are never written."""
+        arr = self.CountingWrites(range(1000, 0, -1))
+        arr[600] = 995
+        resort_decreasing_inplace(arr, [600])
+        self.assertEqual(list(arr), sorted(arr, reverse=True))
+        self.assertLessEqual(arr.writes, 600 - 5 + 1)
+    
+    def test_typed_buffer(self):
+        """Test array.array and memoryview storage."""
+        rng = random.Random(151)
+        values = array("q", sorted((rng.randint(0, 100) for _ in range(3000)), reverse=True))
+        dirty = rng.sample(range(3000), 40)
+        for index in dirty:
+            values[index] = rng.randint(-50, 150)
+        expected = sorted(values, reverse=True)
+        resort_decreasing_inplace(memoryview(values), dirty)
+        self.assertEqual(values.tolist(), expected)
+    
+    def test_no_edits(self):
+        """Test that nothing happens without dirty indices or tail."""
+        arr = [3, 2, 1]
+        self.assertEqual(resort_decreasing_inplace(arr), [3, 2, 1])
+        self.assertEqual(resort_decreasing_inplace([], tail_start=0), [])
+    
+    def test_invalid_indices(self):
+        """Test that out-of-range indices raise IndexError."""
+        with self.assertRaises(IndexError):
+            resort_decreasing_inplace([3, 2, 1], [3])
+        with self.assertRaises(IndexError):
+            resort_decreasing_inplace([3, 2, 1], [-1])
+        with self.assertRaises(IndexError):
+            resort_decreasing_inplace([3, 2, 1], tail_start=4)
+
+
+class TestArgsort(unittest.TestCase):
+    """Test argsort_decreasing and apply_permutation."""
+    
+    def expected_perm(self, values):
+        return sorted(range(len(values)), key=lambda i: values[i], reverse=True)
+    
+    def test_stable_permutation(self):
+        """Test every strategy and backend, ties included."""
+        rng = random.Random(181)
+        values = [rng.randint(0, 9) for _ in range(300)]
+        expected = self.expected_perm(values)
+        backends = ["python", "auto", "radix"] + (["numpy"] if np is not None else [])
+        for strategy in ["linear", "binary", "hybrid", "shell", "library"]:
+            for backend in backends:
+                with self.subTest(strategy=strategy, backend=backend):
+                    perm = argsort_decreasing(values, strategy=strategy, backend=backend)
+                    self.assertIsInstance(perm, array)
+                    self.assertEqual(perm.typecode, "q")
+                    self.assertEqual(perm.tolist(), expected)
+    
+    def test_key_and_input_untouched(self):
+        """Test key= and that neither the input nor its elements are copied."""
+        records = [{"score": score} for score in [3, 9, 1, 9, 4]]
+        original = list(records)
+        perm = argsort_decreasing(records, key=lambda r: r["score"])
+        self.assertEqual(perm.tolist(), [1, 3, 4, 0, 2])
+        self.assertEqual(records, original)
+        self.assertTrue(all(a is b for a, b in zip(records, original)))
+    
+    def test_empty_and_strings(self):
+        """Test empty input and non-numeric elements."""
+        self.assertEqual(argsort_decreasing([]).tolist(), [])
+        self.assertEqual(argsort_decreasing(["pear", "apple", "fig"]).tolist(), [0, 2, 1])
+    
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_ndarray_input(self):
+        """Test that an ndarray gives an integer ndarray permutation."""
+        values = np.array([2.5, 7.0, 2.5, -1.0])
+        perm = argsort_decreasing(values, backend="numpy")
+        self.assertIsInstance(perm, np.ndarray)
+        self.assertEqual(perm.dtype.kind, "i")
+        self.assertEqual(perm.tolist(), [1, 0, 2, 3])
+        self.assertEqual(apply_permutation(perm, values)[0].tolist(), [7.0, 2.5, 2.5, -1.0])
+    
+    def test_apply_to_parallel_columns(self):
+        """Test reordering several columns of different types consistently."""
+        scores = [30, 10, 50, 20]
+        names = ["c", "a", "e", "b"]
+        weights = array("d", [3.0, 1.0, 5.0, 2.0])
+        perm = argsort_decreasing(scores)
+        sorted_scores, sorted_names, sorted_weights = apply_permutation(perm, scores, names, weights)
+        self.assertEqual(sorted_scores, [50, 30, 20, 10])
+        self.assertEqual(sorted_names, ["e", "c", "b", "a"])
+        self.assertEqual(sorted_weights, array("d", [5.0, 3.0, 2.0, 1.0]))
+        self.assertEqual(names, ["c", "a", "e", "b"])
+    
+    def test_apply_inplace(self):
+        """Test in-place application, which leaves perm reusable."""
+        rng = random.Random(191)
+        scores = [rng.random() for _ in range(200)]
+        labels = list(range(200))
+        perm = argsort_decreasing(scores)
+        before = perm.tolist()
+        results = apply_permutation(perm, scores, labels, inplace=True)
+        self.assertIs(results[0], scores)
+        self.assertIs(results[1], labels)
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertEqual(labels, before)
+        self.assertEqual(perm.tolist(), before)
+    
+    def test_length_mismatch(self):
+        """Test that sequences must match the permutation length."""
+        with self.assertRaises(ValueError):
+            apply_permutation(array("q", [1, 0]), [1, 2, 3])
+
+
+class TestRecordSort(unittest.TestCase):
+    """Test the columnar multi-field sort_records_decreasing."""
+    
+    def make_records(self, seed, count=500):
+        rng = random.Random(seed)
+        return [{"team": rng.choice("xyz"), "score": rng.randint(0, 5),
+                 "time": rng.choice([0.5, 1.5, 2.5]), "id": tag} for tag in range(count)]
+    
+    def reference(self, records, fields):
+        """Multi-pass sorted() reference for the same field spec."""
+        result = list(records)
+        for field in reversed(fields):
+            name, direction = field if isinstance(field, tuple) else (field, "desc")
+            result.sort(key=lambda record: record[name], reverse=direction == "desc")
+        return [record["id"] for record in result]
+    
+    def test_field_specs(self):
+        """Test one or several fields, mixed directions, every backend."""
+        records = self.make_records(227)
+        specs = [["score"], [("score", "asc")], ["score", ("team", "asc")],
+                 [("team", "desc"), ("time", "asc"), "score"]]
+        for fields in specs:
+            for backend in ["python", "auto", "radix"]:
+                with self.subTest(fields=fields, backend=backend):
+                    result = sort_records_decreasing(records, fields, backend=backend)
+                    self.assertEqual([record["id"] for record in result],
+                                     self.reference(records, fields))
+    
+    def test_strategies(self):
+        """Test that every comparison strategy gives the same stable order."""
+        records = self.make_records(229, count=200)
+        fields = [("team", "asc"), "time"]
+        expected = self.reference(records, fields)
+        for strategy in ["linear", "binary", "hybrid"]:
+            with self.subTest(strategy=strategy):
+                result = sort_records_decreasing(records, fields, strategy=strategy, backend="python")
+                self.assertEqual([record["id"] for record in result], expected)
+    
+    def test_dataclass_records(self):
+        """Test records with attributes instead of keys."""
+        @dataclass
+        class Player:
+            name: str
+            score: int
+        
+        players = [Player("ann", 3), Player("bob", 7), Player("cid", 3), Player("dee", 7)]
+        result = sort_records_decreasing(players, ["score", ("name", "asc")])
+        self.assertEqual([p.name for p in result], ["bob", "dee", "ann", "cid"])
+        self.assertTrue(all(any(p is q for q in players) for p in result))
+    
+    def test_column_dict(self):
+        """Test a dict of column lists, including typed array columns."""
+        columns = {
+            "name": ["a", "b", "c", "d"],
+            "score": [2, 9, 2, 5],
+            "weight": array("d", [0.1, 0.2, 0.3, 0.4]),
+        }
+        result = sort_records_decreasing(columns, ["score", ("name", "desc")])
+        self.assertEqual(result["name"], ["b", "d", "c", "a"])
+        self.assertEqual(result["score"], [9, 5, 2, 2])
+        self.assertEqual(result["weight"], array("d", [0.2, 0.4, 0.3, 0.1]))
+        self.assertEqual(columns["score"], [2, 9, 2, 5])
+    
+    def test_typed_key_passes(self):
+        """Test that numeric columns reach every pass typed, not as lists."""
+        records = self.make_records(231, count=50)
+        fields = ["score", ("time", "asc"), ("team", "asc")]
+        expected = self.reference(records, fields)
+        cases = [("python", np, list), ("radix", np, array), ("auto", None, array)]
+        if np is not None:
+            cases.append(("auto", np, np.ndarray))
+        for backend, numpy_module, column_type in cases:
+            with self.subTest(backend=backend, numpy=numpy_module is not None):
+                with mock.patch.object(sort_module, "np", numpy_module), \
+                        mock.patch.object(sort_module, "_argsort_keys", wraps=sort_module._argsort_keys) as passes:
+                    result = sort_records_decreasing(records, fields, backend=backend)
+                self.assertEqual([record["id"] for record in result], expected)
+                # Passes run last field first; the string column stays a list.
+                self.assertEqual([type(call.args[0]) for call in passes.call_args_list],
+                                 [list, column_type, column_type])
+    
+    def test_empty_input(self):
+        """Test empty record lists and empty columns."""
+        self.assertEqual(sort_records_decreasing([], ["score"]), [])
+        self.assertEqual(sort_records_decreasing({"score": []}, ["score"]), {"score": []})
+    
+    def test_invalid_arguments(self):
+        """Test bad directions, missing fields and ragged columns."""
+        records = self.make_records(233, count=5)
+        with self.assertRaises(ValueError):
+            sort_records_decreasing(records, [("score", "up")])
+        with self.assertRaises(ValueError):
+            sort_records_decreasing(records, [])
+        with self.assertRaises(KeyError):
+            sort_records_decreasing(records, ["missing"])
+        with self.assertRaises(ValueError):
+            sort_records_decreasing({"a": [1, 2], "b": [1]}, ["a"])
+
+
 class TestPerformance(unittest.TestCase):
     """Performance and stress tests."""
     
@@ -256,6 +2134,195 @@ class TestPerformance(unittest.TestCase):
                 self.assertLess(execution_time, 1.0)
 
 
+class TestBenchmarkSuite(unittest.TestCase):
+    """Smoke tests for the benchmark helpers."""
+    
+    def test_time_engine_discards_warmup(self):
+        """Test that only the timed runs are returned."""
+        samples = time_engine(insertion_sort_decreasing, [3, 1, 2], repeats=4, warmup=2)
+        self.assertEqual(len(samples), 4)
+        self.assertTrue(all(isinstance(sample, int) and sample >= 0 for sample in samples))
+    
+    def test_time_engine_copies_for_inplace(self):
+        """Test that in-place engines get a fresh copy of the input for every run."""
+        arr = [3, 1, 2]
+        received_original = []
+        
+        def engine(data):
+            received_original.append(data is arr)
+            insertion_sort_decreasing_inplace(data)
+        
+        time_engine(engine, arr, inplace=True, repeats=2, warmup=1)
+        self.assertEqual(received_original, [False, False, False])
+        self.assertEqual(arr, [3, 1, 2])
+    
+    def test_summarize_samples(self):
+        """Test min, median and nearest-rank p95."""
+        summary = summarize_samples(list(range(100, 0, -1)))
+        self.assertEqual(summary, {"min_ns": 1, "median_ns": 50.5, "p95_ns": 95})
+    
+    def test_json_report(self):
+        """Test that a small run writes machine-readable results."""
+        with tempfile.TemporaryDirectory() as workdir:
+            json_path = os.path.join(workdir, "bench.json")
+            with redirect_stdout(io.StringIO()):
+                results = run_performance_benchmark(
+                    sizes=[10, 20], repeats=2, warmup=0, json_path=json_path,
+                    engines=[("hybrid", hybrid_sort_decreasing, False, None),
+                             ("linear", insertion_sort_decreasing, False, 10)],
+                    resort_size=None,
+                )
+            with open(json_path) as f:
+                report = json.load(f)
+        
+        self.assertEqual(report["results"], results)
+        self.assertEqual(len(results), len(BENCHMARK_DISTRIBUTIONS) * 3)
+        for entry in results:
+            self.assertLessEqual(entry["min_ns"], entry["median_ns"])
+            self.assertLessEqual(entry["median_ns"], entry["p95_ns"])
+            self.assertEqual(len(entry["samples_ns"]), 2)
+    
+    def test_resort_benchmark(self):
+        """Test the incremental re-sort scenarios on a small list."""
+        with redirect_stdout(io.StringIO()):
+            results = run_resort_benchmark(size=500, dirty_counts=[1, 10], repeats=2, warmup=0)
+        self.assertEqual(
+            [(entry["engine"], entry["distribution"]) for entry in results],
+            [("resort", "dirty_1"), ("hybrid_inplace", "dirty_1"),
+             ("resort", "dirty_10"), ("hybrid_inplace", "dirty_10")],
+        )
+        self.assertTrue(all(len(entry["samples_ns"]) == 2 for entry in results))
+
+
+class TestBenchmarkComparison(unittest.TestCase):
+    """Test cases for the benchmark regression gate."""
+    
+    @staticmethod
+    def result(samples, engine="hybrid", distribution="random", size=1000):
+        samples = [sample * 1000 for sample in samples]  # microseconds to nanoseconds
+        return {"engine": engine, "distribution": distribution, "size": size,
+                "median_ns": statistics.median(samples), "samples_ns": samples}
+    
+    def test_mann_whitney_detects_shift(self):
+        """Test that a clear slowdown is significant and identical samples are not."""
+        baseline = [100, 102, 98, 101, 99, 103, 100]
+        slower = [130, 128, 133, 131, 129, 135, 130]
+        self.assertLess(mann_whitney_greater(slower, baseline), 0.01)
+        self.assertGreater(mann_whitney_greater(baseline, slower), 0.99)
+        self.assertEqual(mann_whitney_greater([5] * 7, [5] * 7), 1.0)
+    
+    def test_regression_flagged(self):
+        """Test that a significant slowdown beyond the threshold is a regression."""
+        rows = compare_benchmark_results(
+            [self.result([100, 102, 98, 101, 99, 103, 100])],
+            [self.result([130, 128, 133, 131, 129, 135, 130])],
+        )
+        self.assertEqual(rows[0]["status"], "regression")
+        self.assertAlmostEqual(rows[0]["factor"], 1.3)
+    
+    def test_noise_is_not_a_regression(self):
+        """Test that a slower median driven by overlapping noise passes."""
+        rows = compare_benchmark_results(
+            [self.result([100, 150, 90, 140, 95, 160, 100])],
+            [self.result([120, 95, 150, 100, 145, 90, 155])],
+        )
+        self.assertEqual(rows[0]["status"], "ok")
+    
+    def test_small_slowdown_under_threshold(self):
+        """Test that a significant but small slowdown stays under the threshold."""
+        rows = compare_benchmark_results(
+            [self.result([100, 101, 100, 102, 100, 101, 100])],
+            [self.result([105, 106, 105, 107, 105, 106, 105])],
+            threshold=0.10,
+        )
+        self.assertEqual(rows[0]["status"], "ok")
+    
+    def test_jitter_below_absolute_floor(self):
+        """Test that a large relative change of a tiny scenario is ignored."""
+        baseline = [{"engine": "linear", "distribution": "random", "size": 10,
+                     "median_ns": 1000, "samples_ns": [1000] * 7}]
+        current = [{"engine": "linear", "distribution": "random", "size": 10,
+                    "median_ns": 1500, "samples_ns": [1500] * 7}]
+        self.assertEqual(compare_benchmark_results(baseline, current)[0]["status"], "ok")
+        self.assertEqual(compare_benchmark_results(baseline, current, min_delta_ns=0)[0]["status"],
+                         "regression")
+    
+    def test_improvement_new_and_missing(self):
+        """Test speedups and scenarios present on only one side."""
+        rows = compare_benchmark_results(
+            [self.result([200, 201, 199, 202, 200, 198, 201]), self.result([1, 1], engine="gone")],
+            [self.result([100, 101, 99, 102, 100, 98, 101]), self.result([1, 1], engine="added")],
+        )
+        statuses = {row["engine"]: row["status"] for row in rows}
+        self.assertEqual(statuses, {"hybrid": "improvement", "gone": "missing", "added": "new"})
+
+
+class TestComplexityProfile(unittest.TestCase):
+    """Test cases for the empirical complexity profiler."""
+    
+    SIZES = [2**k for k in range(8, 15)]
+    
+    def test_fit_recovers_exact_models(self):
+        """Test that noiseless timings give the model's exponent and best fit."""
+        for name, model in COMPLEXITY_MODELS.items():
+            with self.subTest(model=name):
+                fit = fit_complexity(self.SIZES, [3 * model(n) for n in self.SIZES])
+                self.assertAlmostEqual(fit["exponent"], model_exponent(name, self.SIZES), delta=0.02)
+                self.assertAlmostEqual(fit["ci"], 0.0, delta=0.05)
+                self.assertEqual(fit["best_model"], name)
+    
+    def test_confidence_interval(self):
+        """Test that noise widens the interval and two sizes leave it unbounded."""
+        rng = random.Random(229)
+        noisy = [n * n * rng.uniform(0.5, 2.0) for n in self.SIZES]
+        fit = fit_complexity(self.SIZES, noisy)
+        self.assertGreater(fit["ci"], 0.0)
+        self.assertLess(abs(fit["exponent"] - 2), 3 * fit["ci"] + 0.1)
+        self.assertEqual(fit_complexity([10, 100], [1, 100])["ci"], math.inf)
+    
+    def test_model_exponent(self):
+        """Test the log-log slopes of the candidate models."""
+        self.assertAlmostEqual(model_exponent("n", self.SIZES), 1.0)
+        self.assertAlmostEqual(model_exponent("n^2", self.SIZES), 2.0)
+        self.assertAlmostEqual(model_exponent("n log n", [256, 16384]), 1 + math.log(1.75) / math.log(64))
+    
+    def test_quadratic_engine_is_flagged(self):
+        """Test that an engine that goes quadratic is flagged against an O(n) class."""
+        def quadratic(arr):
+            return sum(1 for _ in arr for _ in arr)
+        
+        sizes = [32, 64, 128, 256, 512]
+        with redirect_stdout(io.StringIO()):
+            rows = run_complexity_profile(sizes=sizes, repeats=2, warmup=0,
+                                          engines=[("quadratic", quadratic, False, None)],
+                                          expected={"quadratic": "n"})
+        self.assertEqual(len(rows), len(BENCHMARK_DISTRIBUTIONS))
+        self.assertTrue(all(row["flagged"] for row in rows))
+        self.assertTrue(all(row["best_model"] == "n^2" for row in rows))
+        
+        with redirect_stdout(io.StringIO()):
+            rows = run_complexity_profile(sizes=sizes, repeats=2, warmup=0,
+                                          engines=[("quadratic", quadratic, False, None)],
+                                          expected={"quadratic": "n^2"})
+        for row in rows:
+            with self.subTest(distribution=row["distribution"]):
+                if row["distribution"] in PROFILE_PRESORTED:
+                    self.assertEqual(row["expected"], "n")
+                    self.assertTrue(row["flagged"])
+                else:
+                    self.assertEqual(row["expected"], "n^2")
+                    self.assertFalse(row["flagged"])
+    
+    def test_every_engine_has_an_expected_class(self):
+        """Test that no benchmark engine is silently left out of the profile."""
+        names = [name for name, *_ in BENCHMARK_ENGINES]
+        for name in names:
+            self.assertIn(PROFILE_EXPECTED.get(name), COMPLEXITY_MODELS, name)
+        for name, model in PROFILE_PRESORTED_EXPECTED.items():
+            self.assertIn(name, names)
+            self.assertIn(model, COMPLEXITY_MODELS, name)
+
+
 class TestEdgeCases(unittest.TestCase):
     """Edge cases and boundary conditions."""
     
@@ -443,9 +2510,11 @@ class TestNegativeCases(unittest.TestCase):
                     self.assertGreaterEqual(result[i], result[i + 1])
     
     def test_nan_values(self):
-        """Test arrays containing NaN values (NaN comparisons are unpredictable)."""
-        import math
+        """Test arrays containing NaN values (NaN comparisons are unpredictable).
         
+        The comparison engines give no placement guarantee for NaN; the NumPy
+        backend's NaN policy is covered in TestNumpyBackend.
+        """
         nan_arrays = [
             [1, float('nan'), 3],
             [float('nan'), 1, 3],
@@ -565,40 +2634,422 @@ class TestHelperFunctions(unittest.TestCase):
             pass  # Expected behavior
 
 
-def run_performance_benchmark():
-    """Run a performance benchmark comparing different scenarios."""
+# Benchmark configuration. Quadratic engines are capped at sizes where a
+# single run still finishes in well under a second.
+BENCHMARK_SIZES = [10, 100, 1000, 10000, 100000]
+BENCHMARK_REPEATS = 7
+BENCHMARK_WARMUP = 1
+BENCHMARK_JSON = "benchmark_results.json"
+
+
+def _nearly_sorted(n, rng):
+    arr = list(range(n - 1, -1, -1))
+    for _ in range(max(1, n // 100)):
+        i = rng.randrange(n)
+        j = rng.randrange(n)
+        arr[i], arr[j] = arr[j], arr[i]
+    return arr
+
+
+def _organ_pipe(n, rng):
+    half = n // 2
+    return list(range(half)) + list(range(n - half - 1, -1, -1))
+
+
+BENCHMARK_DISTRIBUTIONS = [
+    ("random", lambda n, rng: [rng.randint(1, 1000) for _ in range(n)]),
+    ("ascending", lambda n, rng: list(range(n))),
+    ("descending", lambda n, rng: list(range(n - 1, -1, -1))),
+    ("all_same", lambda n, rng: [42] * n),
+    ("nearly_sorted", _nearly_sorted),
+    ("few_unique", lambda n, rng: [rng.randint(1, 4) for _ in range(n)]),
+    ("sawtooth", lambda n, rng: [i % max(1, n // 10) for i in range(n)]),
+    ("organ_pipe", _organ_pipe),
+]
+
+# (name, function, sorts its argument in place, largest size to run)
+BENCHMARK_ENGINES = [
+    ("linear", insertion_sort_decreasing, False, 1000),
+    ("linear_inplace", insertion_sort_decreasing_inplace, True, 1000),
+    ("binary", lambda arr: insertion_sort_decreasing(arr, strategy="binary"), False, 10000),
+    ("hybrid", hybrid_sort_decreasing, False, None),
+    ("hybrid_inplace", hybrid_sort_decreasing_inplace, True, None),
+    ("shell_ciura", lambda arr: shell_sort_decreasing_inplace(arr, "ciura"), True, None),
+    ("shell_tokuda", lambda arr: shell_sort_decreasing_inplace(arr, "tokuda"), True, None),
+    ("shell_sedgewick", lambda arr: shell_sort_decreasing_inplace(arr, "sedgewick"), True, None),
+    ("library_eps_0.25", lambda arr: library_sort_decreasing_inplace(arr, 0.25), True, None),
+    ("library_eps_1", lambda arr: library_sort_decreasing_inplace(arr, 1.0), True, None),
+    ("integer", lambda arr: insertion_sort_decreasing(arr, backend="radix"), False, None),
+    ("top_k_10", lambda arr: top_k_decreasing(arr, 10), False, None),
+    ("top_k_1000", lambda arr: top_k_decreasing(arr, 1000), False, None),
+]
+# Incremental re-sort: a sorted list of RESORT_BENCHMARK_SIZE values with this
+# many entries overwritten, restored by resort_decreasing_inplace and, for
+# comparison, by a full in-place hybrid sort
+RESORT_BENCHMARK_SIZE = 10**6
+RESORT_DIRTY_COUNTS = [1, 10, 1000]
+if np is not None:
+    BENCHMARK_ENGINES.append(
+        ("numpy", lambda arr: insertion_sort_decreasing(arr, backend="numpy"), False, None)
+    )
+
+
+def _percentile(sorted_samples, fraction):
+    """Nearest-rank percentile of an already sorted sample list."""
+    rank = max(1, math.ceil(fraction * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def time_engine(function, arr, inplace=False, repeats=BENCHMARK_REPEATS, warmup=BENCHMARK_WARMUP):
+    """Time function(arr) and return the per-run samples in nanoseconds.
+    
+    Warmup runs are discarded. In-place engines get a fresh copy of the
+    input for every run, made outside the timed region.
+    """
+    samples = []
+    for run in range(warmup + repeats):
+        data = arr.copy() if inplace else arr
+        start = time.perf_counter_ns()
+        function(data)
+        elapsed = time.perf_counter_ns() - start
+        if run >= warmup:
+            samples.append(elapsed)
+    return samples
+
+
+def summarize_samples(samples):
+    """Return min/median/p95 (nanoseconds) of a list of timing samples."""
+    ordered = sorted(samples)
+    return {
+        "min_ns": ordered[0],
+        "median_ns": statistics.median(ordered),
+        "p95_ns": _percentile(ordered, 0.95),
+    }
+
+
+def _format_ns(ns):
+    if ns >= 1e9:
+        return f"{ns / 1e9:.3f}s"
+    if ns >= 1e6:
+        return f"{ns / 1e6:.3f}ms"
+    return f"{ns / 1e3:.1f}us"
+
+
+def run_resort_benchmark(size=RESORT_BENCHMARK_SIZE, dirty_counts=None, repeats=BENCHMARK_REPEATS,
+                         warmup=BENCHMARK_WARMUP, seed=42):
+    """Time incremental re-sorts against a full re-sort and return result rows.
+    
+    For each dirty count, that many random entries of a sorted list are
+    overwritten with random values. The rows use the same format as
+    run_performance_benchmark, with distribution "dirty_<count>".
+    """
+    dirty_counts = RESORT_DIRTY_COUNTS if dirty_counts is None else dirty_counts
+    rng = random.Random(seed)
+    base = sorted((rng.random() for _ in range(size)), reverse=True)
+    
+    print(f"\nincremental re-sort ({size} elements):")
+    print(f"{'engine':<16}{'dirty':>8}{'min':>12}{'median':>12}{'p95':>12}")
+    print("-" * 60)
+    
+    results = []
+    for count in dirty_counts:
+        arr = base.copy()
+        dirty = rng.sample(range(size), min(count, size))
+        for index in dirty:
+            arr[index] = rng.random()
+        engines = [
+            ("resort", lambda data: resort_decreasing_inplace(data, dirty)),
+            ("hybrid_inplace", hybrid_sort_decreasing_inplace),
+        ]
+        for name, function in engines:
+            samples = time_engine(function, arr, True, repeats, warmup)
+            summary = summarize_samples(samples)
+            results.append({
+                "engine": name,
+                "distribution": f"dirty_{count}",
+                "size": size,
+                "repeats": repeats,
+                "warmup": warmup,
+                **summary,
+                "samples_ns": samples,
+            })
+            print(f"{name:<16}{count:>8}{_format_ns(summary['min_ns']):>12}"
+                  f"{_format_ns(summary['median_ns']):>12}{_format_ns(summary['p95_ns']):>12}")
+    return results
+
+
+def run_performance_benchmark(sizes=None, repeats=BENCHMARK_REPEATS, warmup=BENCHMARK_WARMUP,
+                              json_path=BENCHMARK_JSON, seed=42, engines=None,
+                              resort_size=RESORT_BENCHMARK_SIZE):
+    """Run the benchmark suite and return its results.
+    
+    Every engine runs on every distribution at every size up to its cap,
+    with warmup runs and repeated timed runs, followed by the incremental
+    re-sort scenarios unless resort_size is None. A table of min/median/p95
+    is printed and, unless json_path is None, the same results (including
+    the raw samples) are written there as JSON.
+    """
+    sizes = BENCHMARK_SIZES if sizes is None else sizes
+    engines = BENCHMARK_ENGINES if engines is None else engines
+    
     print("\n" + "="*60)
     print("PERFORMANCE BENCHMARK")
     print("="*60)
+    print(f"perf_counter_ns, {warmup} warmup + {repeats} timed runs per scenario")
     
-    scenarios = [
-        ("Random Array", lambda n: [random.randint(1, 1000) for _ in range(n)]),
-        ("Ascending Order", lambda n: list(range(n))),
-        ("Descending Order", lambda n: list(range(n-1, -1, -1))),
-        ("All Same", lambda n: [42] * n),
-    ]
-    
-    sizes = [10, 50, 100, 500]
-    
-    for scenario_name, generator in scenarios:
-        print(f"\n{scenario_name}:")
-        print("-" * 40)
+    results = []
+    for distribution, generator in BENCHMARK_DISTRIBUTIONS:
+        print(f"\n{distribution}:")
+        print(f"{'engine':<16}{'size':>8}{'min':>12}{'median':>12}{'p95':>12}")
+        print("-" * 60)
         
         for size in sizes:
-            arr = generator(size)
-            
-            # Test non-inplace version
-            start_time = time.time()
-            result1 = insertion_sort_decreasing(arr)
-            time1 = time.time() - start_time
-            
-            # Test inplace version
-            arr_copy = arr.copy()
-            start_time = time.time()
-            result2 = insertion_sort_decreasing_inplace(arr_copy)
-            time2 = time.time() - start_time
-            
-            print(f"Size {size:3d}: Non-inplace: {time1:.6f}s, In-place: {time2:.6f}s")
+            arr = generator(size, random.Random(seed))
+            for name, function, inplace, max_size in engines:
+                if max_size is not None and size > max_size:
+                    continue
+                samples = time_engine(function, arr, inplace, repeats, warmup)
+                summary = summarize_samples(samples)
+                results.append({
+                    "engine": name,
+                    "distribution": distribution,
+                    "size": size,
+                    "repeats": repeats,
+                    "warmup": warmup,
+                    **summary,
+                    "samples_ns": samples,
+                })
+                print(f"{name:<16}{size:>8}{_format_ns(summary['min_ns']):>12}"
+                      f"{_format_ns(summary['median_ns']):>12}{_format_ns(summary['p95_ns']):>12}")
+    
+    if resort_size is not None:
+        results.extend(run_resort_benchmark(resort_size, repeats=repeats, warmup=warmup, seed=seed))
+    
+    if json_path is not None:
+        report = {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "results": results,
+        }
+        with open(json_path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {json_path}")
+    
+    return results
+
+
+def mann_whitney_greater(current, baseline):
+    """One-sided Mann-Whitney U test that current samples tend to be larger.
+    
+    Uses the normal approximation with tie and continuity corrections and
+    returns the p-value. Needs no assumption about the timing distribution,
+    which is usually skewed by scheduler noise.
+    """
+    n1 = len(current)
+    n2 = len(baseline)
+    if not n1 or not n2:
+        return 1.0
+    u = sum(1.0 if c > b else 0.5 if c == b else 0.0 for c in current for b in baseline)
+    
+    total = n1 + n2
+    tie_term = sum(t ** 3 - t for t in collections.Counter(current + baseline).values())
+    variance = n1 * n2 / 12 * ((total + 1) - tie_term / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+BENCHMARK_MIN_DELTA_NS = 2000
+
+
+def compare_benchmark_results(baseline, current, threshold=0.10, alpha=0.05,
+                              min_delta_ns=BENCHMARK_MIN_DELTA_NS):
+    """Compare two lists of benchmark results scenario by scenario.
+    
+    A scenario regresses when its median slowed down by more than threshold
+    and the slowdown is statistically significant at level alpha. Changes
+    smaller than min_delta_ns are treated as timer jitter. Returns a
+    list of rows sorted by scenario; scenarios present on only one side are
+    reported with status "new" or "missing".
+    """
+    def by_scenario(results):
+        return {(r["engine"], r["distribution"], r["size"]): r for r in results}
+    
+    old = by_scenario(baseline)
+    new = by_scenario(current)
+    rows = []
+    for scenario in sorted(set(old) | set(new), key=lambda s: (s[1], s[0], s[2])):
+        engine, distribution, size = scenario
+        row = {"engine": engine, "distribution": distribution, "size": size,
+               "baseline_ns": None, "current_ns": None, "factor": None, "p_value": None}
+        if scenario not in old or scenario not in new:
+            row["status"] = "new" if scenario in new else "missing"
+            rows.append(row)
+            continue
+        row["baseline_ns"] = old[scenario]["median_ns"]
+        row["current_ns"] = new[scenario]["median_ns"]
+        row["factor"] = row["current_ns"] / row["baseline_ns"] if row["baseline_ns"] else 1.0
+        row["p_value"] = mann_whitney_greater(new[scenario]["samples_ns"],
+                                              old[scenario]["samples_ns"])
+        delta = abs(row["current_ns"] - row["baseline_ns"])
+        if delta < min_delta_ns:
+            row["status"] = "ok"
+        elif row["factor"] > 1 + threshold and row["p_value"] < alpha:
+            row["status"] = "regression"
+        elif row["factor"] < 1 / (1 + threshold) and \
+                mann_whitney_greater(old[scenario]["samples_ns"], new[scenario]["samples_ns"]) < alpha:
+            row["status"] = "improvement"
+        else:
+            row["status"] = "ok"
+        rows.append(row)
+    return rows
+
+
+# Complexity profile: every engine runs over a geometric range of sizes and
+# its timings are fitted to a power law and to the candidate growth models
+PROFILE_SIZES = [2**k for k in range(8, 15)]
+PROFILE_REPEATS = 3
+PROFILE_QUADRATIC_CAP = 4096
+PROFILE_TOLERANCE = 0.2
+COMPLEXITY_MODELS = {
+    "n": lambda n: n,
+    "n log n": lambda n: n * math.log(n),
+    "n^2": lambda n: n * n,
+}
+# Expected worst-case growth of each engine on the profile distributions.
+# Presorted distributions use PROFILE_PRESORTED_EXPECTED instead.
+PROFILE_EXPECTED = {
+    "linear": "n^2",
+    "linear_inplace": "n^2",
+    "binary": "n^2",
+    "hybrid": "n log n",
+    "hybrid_inplace": "n log n",
+    "shell_ciura": "n log n",
+    "shell_tokuda": "n log n",
+    "shell_sedgewick": "n log n",
+    "library_eps_0.25": "n log n",
+    "library_eps_1": "n log n",
+    "integer": "n",
+    "top_k_10": "n",
+    "top_k_1000": "n",
+    "numpy": "n log n",
+}
+PROFILE_PRESORTED = {"ascending", "descending", "all_same"}
+# Expected growth on presorted input, "n" for engines not listed: the sorts
+# take an O(n) fast path there. top_k has none, and ascending input is its
+# worst case, since every value enters the window at the front.
+PROFILE_PRESORTED_EXPECTED = {
+    "top_k_10": "n log n",
+    "top_k_1000": "n log n",
+}
+# Two-sided 95% Student t quantiles by degrees of freedom
+_T_95 = {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+         8: 2.306, 9: 2.262, 10: 2.228, 15: 2.131, 20: 2.086, 30: 2.042}
+
+
+def _t_quantile(df):
+    """95% t quantile, rounded toward the next smaller tabulated df."""
+    known = [d for d in _T_95 if d <= df]
+    return _T_95[max(known)] if df <= 30 else 1.96
+
+
+def model_exponent(model, sizes):
+    """Log-log slope of a growth model between the smallest and largest size."""
+    f = COMPLEXITY_MODELS[model]
+    lo, hi = min(sizes), max(sizes)
+    return math.log(f(hi) / f(lo)) / math.log(hi / lo)
+
+
+def fit_complexity(sizes, times):
+    """Fit timings against input sizes.
+    
+    Returns the least-squares slope of log(time) on log(size) with the
+    half-width of its 95% confidence interval (infinite with fewer than
+    three sizes), and the candidate model with the smallest squared
+    residual in log space once its constant factor is fitted.
+    """
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(t, 1)) for t in times]
+    mean_x = statistics.fmean(xs)
+    mean_y = statistics.fmean(ys)
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sxx
+    intercept = mean_y - slope * mean_x
+    
+    df = len(xs) - 2
+    if df > 0:
+        rss = sum((y - intercept - slope * x) ** 2 for x, y in zip(xs, ys))
+        ci = _t_quantile(df) * math.sqrt(rss / df / sxx)
+    else:
+        ci = math.inf
+    
+    residuals = {}
+    for name, model in COMPLEXITY_MODELS.items():
+        offsets = [y - math.log(model(n)) for n, y in zip(sizes, ys)]
+        mean = statistics.fmean(offsets)
+        residuals[name] = sum((v - mean) ** 2 for v in offsets)
+    return {"exponent": slope, "ci": ci, "best_model": min(residuals, key=residuals.get)}
+
+
+def run_complexity_profile(sizes=None, repeats=PROFILE_REPEATS, warmup=BENCHMARK_WARMUP, seed=42,
+                           engines=None, expected=None, tolerance=PROFILE_TOLERANCE):
+    """Profile how each engine's running time grows and return result rows.
+    
+    Every engine with an expected class runs on every benchmark
+    distribution over the given sizes; engines expected to be quadratic
+    stop at PROFILE_QUADRATIC_CAP. The fastest of the timed runs at each
+    size is fitted with fit_complexity. A row is flagged when even the
+    lower end of the exponent's confidence interval exceeds the slope of
+    the expected model by more than tolerance. A table is printed as the
+    rows are produced.
+    """
+    sizes = PROFILE_SIZES if sizes is None else sizes
+    engines = BENCHMARK_ENGINES if engines is None else engines
+    expected = PROFILE_EXPECTED if expected is None else expected
+    
+    print("\n" + "="*60)
+    print("COMPLEXITY PROFILE")
+    print("="*60)
+    print(f"sizes {sizes[0]}..{sizes[-1]}, fastest of {repeats} timed runs, "
+          f"tolerance {tolerance} on the exponent")
+    
+    results = []
+    for distribution, generator in BENCHMARK_DISTRIBUTIONS:
+        print(f"\n{distribution}:")
+        print(f"{'engine':<18}{'exponent':>16}{'best fit':>10}{'expected':>10}  status")
+        print("-" * 62)
+        inputs = {size: generator(size, random.Random(seed)) for size in sizes}
+        for name, function, inplace, _ in engines:
+            if name not in expected:
+                continue
+            if distribution in PROFILE_PRESORTED:
+                model = PROFILE_PRESORTED_EXPECTED.get(name, "n")
+            else:
+                model = expected[name]
+            engine_sizes = sizes
+            if expected[name] == "n^2":
+                engine_sizes = [size for size in sizes if size <= PROFILE_QUADRATIC_CAP]
+            times = [min(time_engine(function, inputs[size], inplace, repeats, warmup))
+                     for size in engine_sizes]
+            fit = fit_complexity(engine_sizes, times)
+            limit = model_exponent(model, engine_sizes) + tolerance
+            flagged = fit["exponent"] - fit["ci"] > limit
+            results.append({
+                "engine": name,
+                "distribution": distribution,
+                "sizes": engine_sizes,
+                "times_ns": times,
+                **fit,
+                "expected": model,
+                "limit": limit,
+                "flagged": flagged,
+            })
+            exponent = f"{fit['exponent']:.2f} ± {fit['ci']:.2f}"
+            print(f"{name:<18}{exponent:>16}{fit['best_model']:>10}{model:>10}  "
+                  f"{'EXCEEDS' if flagged else 'ok'}")
+    return results
 
 
 def run_stress_test():